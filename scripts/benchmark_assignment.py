@@ -0,0 +1,76 @@
+"""
+Benchmark the batch-window assignment used by MatchingService.
+
+For growing problem sizes (riders waiting at a station x drivers arriving in
+one window) it reports the solve time of the min-cost assignment and how
+many riders it seats compared with first-come first-served greedy matching.
+Each driver serves 1-3 of the destinations, as a route-aware driver would.
+
+Usage:
+    python scripts/benchmark_assignment.py [--repeat 5] [--seed 1]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.matching_service.assignment import assign_greedy, assign_riders
+
+SIZES = [(10, 2), (25, 5), (50, 10), (100, 20), (200, 40), (400, 80)]
+DESTINATIONS = [f"DEST-{i}" for i in range(6)]
+
+
+def make_problem(rng, n_riders, n_drivers):
+    riders = [
+        {"rider_id": f"r{i}", "destination": rng.choice(DESTINATIONS), "arrival_time": rng.randint(0, 600_000)}
+        for i in range(n_riders)
+    ]
+    drivers = [
+        {"driver_id": f"d{i}", "seats": rng.randint(1, 5), "destinations": set(rng.sample(DESTINATIONS, rng.randint(1, 3)))}
+        for i in range(n_drivers)
+    ]
+    return drivers, riders
+
+
+def seated(assignment):
+    return sum(len(riders) for riders in assignment.values())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    print(f"{'riders':>7} {'drivers':>8} {'seats':>6} {'solve p50 ms':>13} {'solve max ms':>13} {'greedy ms':>10} {'seated opt':>11} {'seated greedy':>14}")
+    for n_riders, n_drivers in SIZES:
+        times, greedy_times, opt_seated, greedy_seated, seats = [], [], [], [], []
+        for _ in range(args.repeat):
+            drivers, riders = make_problem(rng, n_riders, n_drivers)
+            seats.append(sum(d["seats"] for d in drivers))
+
+            started = time.perf_counter()
+            opt = assign_riders(drivers, riders)
+            times.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            greedy = assign_greedy(drivers, riders)
+            greedy_times.append((time.perf_counter() - started) * 1000)
+
+            opt_seated.append(seated(opt))
+            greedy_seated.append(seated(greedy))
+
+        print(
+            f"{n_riders:>7} {n_drivers:>8} {statistics.mean(seats):>6.0f} "
+            f"{statistics.median(times):>13.2f} {max(times):>13.2f} {statistics.median(greedy_times):>10.2f} "
+            f"{statistics.mean(opt_seated):>11.1f} {statistics.mean(greedy_seated):>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
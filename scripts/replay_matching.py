@@ -0,0 +1,234 @@
+"""
+Offline replay benchmark for MatchingService.
+
+Feeds rider.requests / driver.near_station / trip.updated events straight
+into the handlers in services/matching_service/app.py, with in-process fakes
+instead of RabbitMQ, TripService and NotificationService, and reports
+throughput, per-event latency and memory growth. No services need to run.
+
+Events come from a recording (JSON lines: {"queue": "...", "body": {...}})
+or are generated: riders arriving at random stations, drivers passing with
+random seats, trips completing now and then.
+
+Events are delivered in bursts of --burst, like the deliveries pika
+dispatches from one socket read, and timers (the collapse drain, batch
+windows) run after each burst. An event's latency is the time from the
+start of its burst until the burst is fully handled.
+
+Usage:
+    python scripts/replay_matching.py [--events 200000] [--stations 200] [--seed 1]
+    python scripts/replay_matching.py --input recorded.jsonl
+    python scripts/replay_matching.py --wal            # include write-ahead logging
+    python scripts/replay_matching.py --burst 32 --stale-fraction 0.3   # a backlog spike
+    python scripts/replay_matching.py --min-eps 20000  # exit 1 below this rate (CI guard)
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeMethod:
+    __slots__ = ("delivery_tag",)
+
+    def __init__(self, tag):
+        self.delivery_tag = tag
+
+
+class FakeConnection:
+    """Runs call_later() timers when the replay clock passes them (batch-window mode)."""
+
+    def __init__(self):
+        self.timers = []
+
+    def call_later(self, delay, callback):
+        self.timers.append((time.monotonic() + delay, callback))
+
+    def run_due(self, force=False):
+        now = time.monotonic()
+        due = [t for t in self.timers if force or t[0] <= now]
+        if due:
+            self.timers = [t for t in self.timers if t not in due]
+            for _, callback in due:
+                callback()
+
+
+class FakeChannel:
+    def __init__(self):
+        self.connection = FakeConnection()
+        self.acked = 0
+        self.nacked = 0
+
+    def basic_ack(self, delivery_tag, multiple=False):
+        self.acked += 1
+
+    def basic_nack(self, delivery_tag, multiple=False, requeue=True):
+        self.nacked += 1
+
+
+def synthetic_events(n, stations, destinations, drivers, seed, stale_fraction=0.0):
+    rng = random.Random(seed)
+    station_ids = [f"ST-{i:04d}" for i in range(stations)]
+    dest_ids = [f"DEST-{i}" for i in range(destinations)]
+    driver_dest = {f"drv-{i}": rng.choice(dest_ids) for i in range(drivers)}
+    ts = int(time.time() * 1000)
+    for i in range(n):
+        ts += rng.randint(0, 20)
+        roll = rng.random()
+        if roll < 0.55:
+            yield "rider.requests", {
+                "rider_id": f"rider-{i}",
+                "station_id": rng.choice(station_ids),
+                "destination": rng.choice(dest_ids),
+                "arrival_time": ts,
+                "request_id": f"req-{i}",
+            }
+        elif roll < 0.57:
+            # a redelivery of a recent request
+            j = max(0, i - rng.randint(1, 50))
+            yield "rider.requests", {
+                "rider_id": f"rider-{j}",
+                "station_id": station_ids[j % stations],
+                "destination": dest_ids[j % destinations],
+                "arrival_time": ts,
+                "request_id": f"req-{j}",
+            }
+        elif roll < 0.97:
+            driver_id = rng.choice(list(driver_dest))
+            yield "driver.near_station", {
+                "driver_id": driver_id,
+                "station_id": rng.choice(station_ids),
+                "destination": driver_dest[driver_id],
+                "available_seats": rng.randint(0, 5),
+                "event": rng.choice(["enter", "enter", "dwell", "exit"]),
+                # a backlog: the event sat in the queue for minutes
+                "ts": int(time.time() * 1000) - 600000 if rng.random() < stale_fraction else ts,
+            }
+        else:
+            yield "trip.updated", {
+                "event": "trip.updated",
+                "status": "completed",
+                "driver_id": rng.choice(list(driver_dest)),
+                "ts": ts,
+            }
+
+
+def recorded_events(path):
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                rec = json.loads(line)
+                yield rec["queue"], rec["body"]
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", help="recorded events, JSON lines {queue, body}")
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--stations", type=int, default=200)
+    parser.add_argument("--destinations", type=int, default=8)
+    parser.add_argument("--drivers", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--burst", type=int, default=1, help="deliveries handled between timer runs")
+    parser.add_argument("--stale-fraction", type=float, default=0.0, help="synthetic driver events that are 10 min old")
+    parser.add_argument("--wal", action="store_true", help="write the state log to a temp dir")
+    parser.add_argument("--tracemalloc", action="store_true", help="exact Python heap growth (slower)")
+    parser.add_argument("--min-eps", type=float, default=0, help="exit 1 if events/s falls below this")
+    args = parser.parse_args()
+
+    # configure the service before importing it
+    os.environ["MATCHING_STATE_DIR"] = tempfile.mkdtemp(prefix="replay-matching-") if args.wal else ""
+    os.environ.setdefault("MATCHING_PARTITIONS", "1")
+    import logging
+    logging.disable(logging.INFO)
+    from services.matching_service import app
+
+    counters = {"published": 0, "trips": 0, "notifications": 0}
+
+    def count(key):
+        def fake(*_args, **_kwargs):
+            counters[key] += 1
+        return fake
+
+    app.publish_event = count("published")
+    app.trip_writer.submit = count("trips")
+    app.notifier.submit = count("notifications")
+    app.restore_state()
+
+    handlers = {
+        "rider.requests": app.on_rider_request,
+        "driver.near_station": app.on_driver_near_station,
+        "trip.updated": app.on_trip_updated,
+    }
+    events = recorded_events(args.input) if args.input else synthetic_events(
+        args.events, args.stations, args.destinations, args.drivers, args.seed, args.stale_fraction
+    )
+
+    ch = FakeChannel()
+    latencies = []
+    if args.tracemalloc:
+        tracemalloc.start()
+    heap_start = tracemalloc.get_traced_memory()[0] if args.tracemalloc else 0
+    rss_start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    def deliver(burst, final=False):
+        t0 = time.perf_counter_ns()
+        for handler, method, payload in burst:
+            handler(ch, method, None, payload)
+        # the last burst also flushes timers still pending (open batch windows)
+        ch.connection.run_due(force=final)
+        latencies.extend([time.perf_counter_ns() - t0] * len(burst))
+
+    started = time.perf_counter()
+    burst = []
+    for tag, (queue, body) in enumerate(events, 1):
+        burst.append((handlers[queue], FakeMethod(tag), json.dumps(body).encode()))
+        if len(burst) == args.burst:
+            deliver(burst)
+            burst = []
+    deliver(burst, final=True)
+    elapsed = time.perf_counter() - started
+
+    heap_end = tracemalloc.get_traced_memory()[0] if args.tracemalloc else 0
+    rss_end = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    latencies.sort()
+    n = len(latencies)
+    eps = n / elapsed if elapsed else 0.0
+
+    print(f"events            {n}  (acked {ch.acked}, nacked {ch.nacked})")
+    print(f"throughput        {eps:,.0f} events/s  ({elapsed:.2f}s)")
+    print(f"latency us        p50 {percentile(latencies, 50) / 1000:.1f}  p99 {percentile(latencies, 99) / 1000:.1f}  "
+          f"max {latencies[-1] / 1000 if n else 0:.1f}  mean {statistics.mean(latencies) / 1000 if n else 0:.1f}")
+    print(f"matches           {counters['trips']} trips, {counters['published']} events published, "
+          f"{counters['notifications']} notifications")
+    print(f"shed              {app.shed.snapshot() or 'none'}")
+    print(f"state             {len(app.waiting_riders)} riders waiting, {len(app.driver_seat_state)} drivers, "
+          f"{len(app.seen_requests)} dedup keys ({app.seen_requests.duplicates} duplicates), "
+          f"{len(app.rider_expiry)} expiry timers")
+    print(f"memory            max RSS {rss_start / 1024:.1f} → {rss_end / 1024:.1f} MiB"
+          + (f", Python heap +{(heap_end - heap_start) / 2**20:.1f} MiB" if args.tracemalloc else ""))
+
+    if app.state_log is not None:
+        app.state_log.close()
+    if args.min_eps and eps < args.min_eps:
+        print(f"FAIL: {eps:,.0f} events/s is below --min-eps {args.min_eps:,.0f}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
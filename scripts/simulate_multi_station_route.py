@@ -4,6 +4,9 @@ Simulates a driver moving through multiple stations, with riders requesting at d
 
 Usage:
     python scripts/simulate_multi_station_route.py
+
+Requests and proximity events go to the station's partition queue; set
+MATCHING_PARTITIONS if the cluster does not use the lastmile-config default.
 """
 import time
 import sys
@@ -0,0 +1,52 @@
+"""
+Key-based partitioning shared by producers and consumers of partitioned queues.
+
+A queue `base` split into N partitions becomes `base.p0` .. `base.p{N-1}`;
+with N <= 1 the plain `base` queue is used. Producers route each message by
+hashing its key (driver_id, station_id, ...) so all messages for one key land
+in the same partition and stay ordered. Consumers divide the partitions
+between live replicas with rendezvous hashing, so a membership change only
+moves the partitions of the replica that joined or left.
+
+Partition queues are declared with single-active-consumer: while ownership
+moves, the new owner's consumer waits until the old owner has cancelled, so
+a partition never has two active consumers.
+"""
+import hashlib
+
+PARTITION_QUEUE_ARGS = {"x-single-active-consumer": True}
+
+
+def _hash64(value):
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def partition_for(key, partitions):
+    if partitions <= 1:
+        return 0
+    return _hash64(str(key)) % partitions
+
+
+def partition_queue(base, partition, partitions):
+    if partitions <= 1:
+        return base
+    return f"{base}.p{partition}"
+
+
+def partition_queues(base, partitions):
+    return [partition_queue(base, p, partitions) for p in range(max(partitions, 1))]
+
+
+def queue_for_key(base, key, partitions):
+    return partition_queue(base, partition_for(key, partitions), partitions)
+
+
+def owner_of(partition, members):
+    """Rendezvous (highest random weight) owner of a partition among members."""
+    return max(members, key=lambda member: _hash64(f"{member}/{partition}"))
+
+
+def assign_partitions(partitions, members, member_id):
+    """Partitions member_id owns given the full set of live members."""
+    members = set(members) | {member_id}
+    return {p for p in range(max(partitions, 1)) if owner_of(p, members) == member_id}
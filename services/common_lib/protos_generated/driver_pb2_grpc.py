@@ -53,6 +53,10 @@ class DriverServiceStub(object):
                 '/lastmile.driver.DriverService/UpdateRoute',
                 request_serializer=driver__pb2.DriverRouteRequest.SerializeToString,
                 response_deserializer=driver__pb2.DriverRouteResponse.FromString)
+        self.ListRoutes = channel.unary_stream(
+                '/lastmile.driver.DriverService/ListRoutes',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=driver__pb2.DriverRouteRequest.FromString)
         self.StreamLocation = channel.stream_unary(
                 '/lastmile.driver.DriverService/StreamLocation',
                 request_serializer=driver__pb2.LocationUpdate.SerializeToString,
@@ -78,6 +82,13 @@ class DriverServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ListRoutes(self, request, context):
+        """latest route of every driver, for MatchingService replicas starting up
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def StreamLocation(self, request_iterator, context):
         """streaming locations from driver -> server
         """
@@ -104,6 +115,11 @@ def add_DriverServiceServicer_to_server(servicer, server):
                     request_deserializer=driver__pb2.DriverRouteRequest.FromString,
                     response_serializer=driver__pb2.DriverRouteResponse.SerializeToString,
             ),
+            'ListRoutes': grpc.unary_stream_rpc_method_handler(
+                    servicer.ListRoutes,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=driver__pb2.DriverRouteRequest.SerializeToString,
+            ),
             'StreamLocation': grpc.stream_unary_rpc_method_handler(
                     servicer.StreamLocation,
                     request_deserializer=driver__pb2.LocationUpdate.FromString,
@@ -177,6 +193,32 @@ class DriverService(object):
             timeout,
             metadata)
 
+    @staticmethod
+    def ListRoutes(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/lastmile.driver.DriverService/ListRoutes',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            driver__pb2.DriverRouteRequest.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata)
+
     @staticmethod
     def StreamLocation(request_iterator,
             target,
@@ -21,7 +21,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0elocation.proto\x12\x11lastmile.location\x1a\x1bgoogle/protobuf/empty.proto\"\x9b\x01\n\x0e\x44riverLocation\x12\x11\n\tdriver_id\x18\x01 \x01(\t\x12\x0b\n\x03lat\x18\x02 \x01(\x01\x12\x0b\n\x03lng\x18\x03 \x01(\x01\x12\n\n\x02ts\x18\x04 \x01(\x03\x12\x12\n\nstation_id\x18\x05 \x01(\t\x12\x17\n\x0f\x61vailable_seats\x18\x06 \x01(\x05\x12\x0e\n\x06\x65ta_ms\x18\x07 \x01(\x03\x12\x13\n\x0b\x64\x65stination\x18\x08 \x01(\t\"W\n\x0eProximityEvent\x12\x11\n\tdriver_id\x18\x01 \x01(\t\x12\x12\n\nstation_id\x18\x02 \x01(\t\x12\x12\n\ndistance_m\x18\x03 \x01(\x01\x12\n\n\x02ts\x18\x04 \x01(\x03\x32\xf5\x01\n\x0fLocationService\x12K\n\x0eReportLocation\x12!.lastmile.location.DriverLocation\x1a\x16.google.protobuf.Empty\x12[\n\x0fStreamProximity\x12!.lastmile.location.DriverLocation\x1a!.lastmile.location.ProximityEvent(\x01\x30\x01\x12\x38\n\x06Health\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.EmptyB\x15Z\x13lastmile/locationpbb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0elocation.proto\x12\x11lastmile.location\x1a\x1bgoogle/protobuf/empty.proto\"\x9b\x01\n\x0e\x44riverLocation\x12\x11\n\tdriver_id\x18\x01 \x01(\t\x12\x0b\n\x03lat\x18\x02 \x01(\x01\x12\x0b\n\x03lng\x18\x03 \x01(\x01\x12\n\n\x02ts\x18\x04 \x01(\x03\x12\x12\n\nstation_id\x18\x05 \x01(\t\x12\x17\n\x0f\x61vailable_seats\x18\x06 \x01(\x05\x12\x0e\n\x06\x65ta_ms\x18\x07 \x01(\x03\x12\x13\n\x0b\x64\x65stination\x18\x08 \x01(\t\"W\n\x0eProximityEvent\x12\x11\n\tdriver_id\x18\x01 \x01(\t\x12\x12\n\nstation_id\x18\x02 \x01(\t\x12\x12\n\ndistance_m\x18\x03 \x01(\x01\x12\n\n\x02ts\x18\x04 \x01(\x03\"*\n\x15\x44riverLocationRequest\x12\x11\n\tdriver_id\x18\x01 \x01(\t\"c\n\x12\x44riversNearRequest\x12\x0b\n\x03lat\x18\x01 \x01(\x01\x12\x0b\n\x03lng\x18\x02 \x01(\x01\x12\x10\n\x08radius_m\x18\x03 \x01(\x01\x12\x12\n\nstation_id\x18\x04 \x01(\t\x12\r\n\x05limit\x18\x05 \x01(\x05\"i\n\x14\x44riversInBBoxRequest\x12\x0f\n\x07min_lat\x18\x01 \x01(\x01\x12\x0f\n\x07min_lng\x18\x02 \x01(\x01\x12\x0f\n\x07max_lat\x18\x03 \x01(\x01\x12\x0f\n\x07max_lng\x18\x04 \x01(\x01\x12\r\n\x05limit\x18\x05 \x01(\x05\"Y\n\x0e\x44riverPosition\x12\x33\n\x08location\x18\x01 \x01(\x0b\x32!.lastmile.location.DriverLocation\x12\x12\n\ndistance_m\x18\x02 \x01(\x01\"E\n\x0f\x44riverPositions\x12\x32\n\x07\x64rivers\x18\x01 \x03(\x0b\x32!.lastmile.location.DriverPosition2\x8f\x04\n\x0fLocationService\x12K\n\x0eReportLocation\x12!.lastmile.location.DriverLocation\x1a\x16.google.protobuf.Empty\x12[\n\x0fStreamProximity\x12!.lastmile.location.DriverLocation\x1a!.lastmile.location.ProximityEvent(\x01\x30\x01\x12`\n\x11GetDriverLocation\x12(.lastmile.location.DriverLocationRequest\x1a!.lastmile.location.DriverLocation\x12X\n\x0b\x44riversNear\x12%.lastmile.location.DriversNearRequest\x1a\".lastmile.location.DriverPositions\x12\\\n\rDriversInBBox\x12\'.lastmile.location.DriversInBBoxRequest\x1a\".lastmile.location.DriverPositions\x12\x38\n\x06Health\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.EmptyB\x15Z\x13lastmile/locationpbb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -33,6 +33,16 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_DRIVERLOCATION']._serialized_end=222
   _globals['_PROXIMITYEVENT']._serialized_start=224
   _globals['_PROXIMITYEVENT']._serialized_end=311
-  _globals['_LOCATIONSERVICE']._serialized_start=314
-  _globals['_LOCATIONSERVICE']._serialized_end=559
+  _globals['_DRIVERLOCATIONREQUEST']._serialized_start=313
+  _globals['_DRIVERLOCATIONREQUEST']._serialized_end=355
+  _globals['_DRIVERSNEARREQUEST']._serialized_start=357
+  _globals['_DRIVERSNEARREQUEST']._serialized_end=456
+  _globals['_DRIVERSINBBOXREQUEST']._serialized_start=458
+  _globals['_DRIVERSINBBOXREQUEST']._serialized_end=563
+  _globals['_DRIVERPOSITION']._serialized_start=565
+  _globals['_DRIVERPOSITION']._serialized_end=654
+  _globals['_DRIVERPOSITIONS']._serialized_start=656
+  _globals['_DRIVERPOSITIONS']._serialized_end=725
+  _globals['_LOCATIONSERVICE']._serialized_start=728
+  _globals['_LOCATIONSERVICE']._serialized_end=1255
 # @@protoc_insertion_point(module_scope)
@@ -52,6 +52,18 @@ class LocationServiceStub(object):
                 '/lastmile.location.LocationService/StreamProximity',
                 request_serializer=location__pb2.DriverLocation.SerializeToString,
                 response_deserializer=location__pb2.ProximityEvent.FromString)
+        self.GetDriverLocation = channel.unary_unary(
+                '/lastmile.location.LocationService/GetDriverLocation',
+                request_serializer=location__pb2.DriverLocationRequest.SerializeToString,
+                response_deserializer=location__pb2.DriverLocation.FromString)
+        self.DriversNear = channel.unary_unary(
+                '/lastmile.location.LocationService/DriversNear',
+                request_serializer=location__pb2.DriversNearRequest.SerializeToString,
+                response_deserializer=location__pb2.DriverPositions.FromString)
+        self.DriversInBBox = channel.unary_unary(
+                '/lastmile.location.LocationService/DriversInBBox',
+                request_serializer=location__pb2.DriversInBBoxRequest.SerializeToString,
+                response_deserializer=location__pb2.DriverPositions.FromString)
         self.Health = channel.unary_unary(
                 '/lastmile.location.LocationService/Health',
                 request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
@@ -73,6 +85,25 @@ class LocationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetDriverLocation(self, request, context):
+        """live driver positions (latest update per driver)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DriversNear(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DriversInBBox(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Health(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -92,6 +123,21 @@ def add_LocationServiceServicer_to_server(servicer, server):
                     request_deserializer=location__pb2.DriverLocation.FromString,
                     response_serializer=location__pb2.ProximityEvent.SerializeToString,
             ),
+            'GetDriverLocation': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDriverLocation,
+                    request_deserializer=location__pb2.DriverLocationRequest.FromString,
+                    response_serializer=location__pb2.DriverLocation.SerializeToString,
+            ),
+            'DriversNear': grpc.unary_unary_rpc_method_handler(
+                    servicer.DriversNear,
+                    request_deserializer=location__pb2.DriversNearRequest.FromString,
+                    response_serializer=location__pb2.DriverPositions.SerializeToString,
+            ),
+            'DriversInBBox': grpc.unary_unary_rpc_method_handler(
+                    servicer.DriversInBBox,
+                    request_deserializer=location__pb2.DriversInBBoxRequest.FromString,
+                    response_serializer=location__pb2.DriverPositions.SerializeToString,
+            ),
             'Health': grpc.unary_unary_rpc_method_handler(
                     servicer.Health,
                     request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
@@ -160,6 +206,84 @@ class LocationService(object):
             timeout,
             metadata)
 
+    @staticmethod
+    def GetDriverLocation(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/lastmile.location.LocationService/GetDriverLocation',
+            location__pb2.DriverLocationRequest.SerializeToString,
+            location__pb2.DriverLocation.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata)
+
+    @staticmethod
+    def DriversNear(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/lastmile.location.LocationService/DriversNear',
+            location__pb2.DriversNearRequest.SerializeToString,
+            location__pb2.DriverPositions.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata)
+
+    @staticmethod
+    def DriversInBBox(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/lastmile.location.LocationService/DriversInBBox',
+            location__pb2.DriversInBBoxRequest.SerializeToString,
+            location__pb2.DriverPositions.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata)
+
     @staticmethod
     def Health(request,
             target,
@@ -52,6 +52,10 @@ class MatchingServiceStub(object):
                 '/lastmile.matching.MatchingService/StreamMatches',
                 request_serializer=matching__pb2.MatchRequest.SerializeToString,
                 response_deserializer=matching__pb2.MatchResponse.FromString)
+        self.StreamState = channel.unary_stream(
+                '/lastmile.matching.MatchingService/StreamState',
+                request_serializer=matching__pb2.ReplicationRequest.SerializeToString,
+                response_deserializer=matching__pb2.StateDelta.FromString)
         self.Health = channel.unary_unary(
                 '/lastmile.matching.MatchingService/Health',
                 request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
@@ -74,6 +78,12 @@ class MatchingServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamState(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Health(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -93,6 +103,11 @@ def add_MatchingServiceServicer_to_server(servicer, server):
                     request_deserializer=matching__pb2.MatchRequest.FromString,
                     response_serializer=matching__pb2.MatchResponse.SerializeToString,
             ),
+            'StreamState': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamState,
+                    request_deserializer=matching__pb2.ReplicationRequest.FromString,
+                    response_serializer=matching__pb2.StateDelta.SerializeToString,
+            ),
             'Health': grpc.unary_unary_rpc_method_handler(
                     servicer.Health,
                     request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
@@ -161,6 +176,32 @@ class MatchingService(object):
             timeout,
             metadata)
 
+    @staticmethod
+    def StreamState(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/lastmile.matching.MatchingService/StreamState',
+            matching__pb2.ReplicationRequest.SerializeToString,
+            matching__pb2.StateDelta.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata)
+
     @staticmethod
     def Health(request,
             target,
@@ -0,0 +1,111 @@
+"""
+Replica membership for partitioned LocationService consumers.
+
+Every replica publishes a heartbeat on a fanout exchange and listens on its
+own exclusive queue bound to it, so each replica knows the set of live
+replicas. A replica that misses MEMBER_EXPIRY_BEATS heartbeats is considered
+gone; a replica shutting down cleanly announces it with a "leave" message.
+on_change(members) is awaited whenever the live set changes. Heartbeats
+carry each replica's gRPC address, for queries that span all partitions.
+"""
+import asyncio
+import json
+import logging
+import time
+
+import aio_pika
+
+logger = logging.getLogger("location_service")
+
+MEMBER_EXPIRY_BEATS = 3
+
+
+class ReplicaMembership:
+    def __init__(self, connection, exchange_name, member_id, heartbeat_s, on_change, address=None):
+        self.connection = connection
+        self.exchange_name = exchange_name
+        self.member_id = member_id
+        self.heartbeat_s = heartbeat_s
+        self.on_change = on_change
+        self.address = address
+        self._last_seen = {member_id: time.monotonic()}
+        self._addresses = {member_id: address}
+        self._published = set()
+        self._dirty = asyncio.Event()
+        self._channel = None
+        self._exchange = None
+        self._task = None
+
+    def members(self):
+        return set(self._last_seen)
+
+    def address_of(self, member):
+        return self._addresses.get(member) if member in self._last_seen else None
+
+    def peer_addresses(self):
+        """Addresses of the other live replicas."""
+        return {m: self._addresses[m] for m in self._last_seen if m != self.member_id and self._addresses.get(m)}
+
+    async def start(self):
+        self._channel = await self.connection.channel()
+        self._exchange = await self._channel.declare_exchange(self.exchange_name, aio_pika.ExchangeType.FANOUT)
+        queue = await self._channel.declare_queue(exclusive=True, auto_delete=True)
+        await queue.bind(self._exchange)
+        await queue.consume(self._on_message, no_ack=True)
+        await self._announce("heartbeat")
+        # collect the other replicas' heartbeats before claiming anything
+        await asyncio.sleep(self.heartbeat_s * 1.5)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+        try:
+            await self._announce("leave")
+        finally:
+            await self._channel.close()
+
+    async def _announce(self, kind):
+        body = json.dumps({"member": self.member_id, "kind": kind, "address": self.address}).encode()
+        await self._exchange.publish(aio_pika.Message(body=body), routing_key="")
+
+    async def _on_message(self, message):
+        data = json.loads(message.body)
+        member = data.get("member")
+        if not member or member == self.member_id:
+            return
+        if data.get("kind") == "leave":
+            self._addresses.pop(member, None)
+            if self._last_seen.pop(member, None) is not None:
+                self._dirty.set()
+        else:
+            if member not in self._last_seen:
+                self._dirty.set()
+            self._last_seen[member] = time.monotonic()
+            self._addresses[member] = data.get("address")
+
+    async def _run(self):
+        while True:
+            self._dirty.clear()
+            now = time.monotonic()
+            self._last_seen[self.member_id] = now
+            expired = [m for m, seen in self._last_seen.items() if now - seen > self.heartbeat_s * MEMBER_EXPIRY_BEATS]
+            for member in expired:
+                del self._last_seen[member]
+                self._addresses.pop(member, None)
+            members = self.members()
+            if members != self._published:
+                self._published = members
+                logger.info("Live replicas: %s", sorted(members))
+                try:
+                    await self.on_change(members)
+                except Exception:
+                    logger.exception("Rebalance failed")
+            try:
+                await self._announce("heartbeat")
+            except Exception as e:
+                logger.warning("Heartbeat publish failed: %s", e)
+            try:
+                await asyncio.wait_for(self._dirty.wait(), self.heartbeat_s)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,114 @@
+"""
+Latest known position of every driver, for LocationService's live-map RPCs.
+
+One __slots__ record per driver plus a lat/lng grid (same bucketing as the
+station index) so radius and bounding-box queries only visit nearby cells.
+The store is owned by the service's event loop and is not thread-safe.
+"""
+import math
+
+from services.location_service.spatial_index import METERS_PER_DEG_LAT, haversine_m
+
+
+class DriverPosition:
+    __slots__ = ("driver_id", "lat", "lng", "ts", "station_id", "available_seats", "eta_ms", "destination", "cell")
+
+    def __init__(self, driver_id):
+        self.driver_id = driver_id
+        self.cell = None
+
+
+class DriverPositionStore:
+    def __init__(self, cell_deg=0.01):
+        self.cell_deg = cell_deg
+        self._drivers = {}   # driver_id -> DriverPosition
+        self._cells = {}     # (row, col) -> set of driver_ids
+
+    def __len__(self):
+        return len(self._drivers)
+
+    def _cell(self, lat, lng):
+        return (math.floor(lat / self.cell_deg), math.floor(lng / self.cell_deg))
+
+    def update(self, driver_id, lat, lng, ts, station_id="", available_seats=0, eta_ms=0, destination=""):
+        """Record a position; returns False (and changes nothing) for an out-of-order update."""
+        pos = self._drivers.get(driver_id)
+        if pos is None:
+            pos = self._drivers[driver_id] = DriverPosition(driver_id)
+        elif ts < pos.ts:
+            return False
+        cell = self._cell(lat, lng)
+        if cell != pos.cell:
+            if pos.cell is not None:
+                self._unlink(driver_id, pos.cell)
+            self._cells.setdefault(cell, set()).add(driver_id)
+            pos.cell = cell
+        pos.lat = lat
+        pos.lng = lng
+        pos.ts = ts
+        pos.station_id = station_id or ""
+        pos.available_seats = available_seats or 0
+        pos.eta_ms = eta_ms or 0
+        pos.destination = destination or ""
+        return True
+
+    def _unlink(self, driver_id, cell):
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.discard(driver_id)
+            if not bucket:
+                del self._cells[cell]
+
+    def get(self, driver_id):
+        return self._drivers.get(driver_id)
+
+    def remove(self, driver_id):
+        pos = self._drivers.pop(driver_id, None)
+        if pos is not None:
+            self._unlink(driver_id, pos.cell)
+
+    def forget(self, predicate):
+        for driver_id in [d for d in self._drivers if predicate(d)]:
+            self.remove(driver_id)
+
+    def evict_older_than(self, cutoff_ts):
+        stale = [d for d, pos in self._drivers.items() if pos.ts < cutoff_ts]
+        for driver_id in stale:
+            self.remove(driver_id)
+        return len(stale)
+
+    def _candidates(self, min_lat, min_lng, max_lat, max_lng):
+        r0, c0 = self._cell(min_lat, min_lng)
+        r1, c1 = self._cell(max_lat, max_lng)
+        if (r1 - r0 + 1) * (c1 - c0 + 1) > len(self._cells):
+            # area covers more cells than are occupied: walk the occupied ones
+            for (row, col), bucket in self._cells.items():
+                if r0 <= row <= r1 and c0 <= col <= c1:
+                    yield from bucket
+            return
+        for row in range(r0, r1 + 1):
+            for col in range(c0, c1 + 1):
+                yield from self._cells.get((row, col), ())
+
+    def near(self, lat, lng, radius_m, limit=0):
+        """Drivers within radius_m of a point as (DriverPosition, distance_m), closest first."""
+        dlat = radius_m / METERS_PER_DEG_LAT
+        dlng = radius_m / (METERS_PER_DEG_LAT * max(math.cos(math.radians(lat)), 0.01))
+        hits = []
+        for driver_id in self._candidates(lat - dlat, lng - dlng, lat + dlat, lng + dlng):
+            pos = self._drivers[driver_id]
+            d = haversine_m(lat, lng, pos.lat, pos.lng)
+            if d <= radius_m:
+                hits.append((pos, d))
+        hits.sort(key=lambda hit: hit[1])
+        return hits[:limit] if limit > 0 else hits
+
+    def in_bbox(self, min_lat, min_lng, max_lat, max_lng, limit=0):
+        hits = []
+        for driver_id in self._candidates(min_lat, min_lng, max_lat, max_lng):
+            pos = self._drivers[driver_id]
+            if min_lat <= pos.lat <= max_lat and min_lng <= pos.lng <= max_lng:
+                hits.append(pos)
+                if 0 < limit <= len(hits):
+                    break
+        return hits
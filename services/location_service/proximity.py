@@ -0,0 +1,105 @@
+"""
+Per-driver station state for LocationService.
+
+Proximity is edge-triggered: a driver produces one "enter" event when it comes
+within the enter radius of a station and one "exit" event once it is further
+than the (larger) exit radius, so GPS jitter around the boundary does not
+flap. While a driver stays at a station a "dwell" event is re-emitted every
+reemit_ms, if enabled.
+
+Updates older than the last one seen for a driver are ignored, whether or not
+the driver is at a station. When the distance to the current station is
+unknown (e.g. the station index has not loaded yet) the driver stays where it
+is, unless the update puts it within the enter radius of another station.
+Drivers that stop reporting are evicted (evict_older_than), with an exit for
+the station they were at.
+"""
+import threading
+
+ENTER = "enter"
+DWELL = "dwell"
+EXIT = "exit"
+
+
+class _DriverState:
+    __slots__ = ("station_id", "last_emit_ts", "last_ts")
+
+    def __init__(self, station_id, ts):
+        self.station_id = station_id
+        self.last_emit_ts = ts
+        self.last_ts = ts
+
+
+class ProximityTracker:
+    def __init__(self, enter_radius_m, exit_radius_m, reemit_ms=0):
+        self.enter_radius_m = enter_radius_m
+        self.exit_radius_m = max(exit_radius_m, enter_radius_m)
+        self.reemit_ms = reemit_ms
+        self._drivers = {}   # driver_id -> _DriverState, only while at a station
+        self._last_ts = {}   # driver_id -> ts of its newest update, every driver
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._drivers)
+
+    def station_of(self, driver_id):
+        st = self._drivers.get(driver_id)
+        return st.station_id if st else None
+
+    def forget(self, predicate):
+        """Drop state for every driver_id matching predicate (e.g. a released partition)."""
+        with self._lock:
+            for driver_id in [d for d in self._drivers if predicate(d)]:
+                del self._drivers[driver_id]
+            for driver_id in [d for d in self._last_ts if predicate(d)]:
+                del self._last_ts[driver_id]
+
+    def evict_older_than(self, ts):
+        """
+        Forget drivers whose last update is older than ts, wherever they are.
+        Returns (driver_id, station_id) for each one evicted while at a
+        station, so the caller can publish its exit.
+        """
+        with self._lock:
+            stale = [d for d, last in self._last_ts.items() if last < ts]
+            left = []
+            for driver_id in stale:
+                del self._last_ts[driver_id]
+                st = self._drivers.pop(driver_id, None)
+                if st is not None:
+                    left.append((driver_id, st.station_id))
+            return left
+
+    def update(self, driver_id, nearest, ts, distance_to):
+        """
+        Feed one location update. nearest is (station_id, distance_m) or None;
+        distance_to(station_id) gives the distance from the same point to any
+        station (None if unknown). Returns a list of (event, station_id,
+        distance_m) transitions to publish.
+        """
+        with self._lock:
+            if ts < self._last_ts.get(driver_id, ts):
+                return []   # out-of-order update
+            self._last_ts[driver_id] = ts
+            st = self._drivers.get(driver_id)
+
+            events = []
+            if st is not None:
+                if nearest and nearest[0] == st.station_id:
+                    d = nearest[1]
+                else:
+                    d = distance_to(st.station_id)
+                moved = nearest and nearest[0] != st.station_id and nearest[1] <= self.enter_radius_m
+                if (d is None and not moved) or (d is not None and d <= self.exit_radius_m):
+                    st.last_ts = ts
+                    if self.reemit_ms and ts - st.last_emit_ts >= self.reemit_ms:
+                        st.last_emit_ts = ts
+                        events.append((DWELL, st.station_id, d))
+                    return events
+                events.append((EXIT, st.station_id, d))
+                del self._drivers[driver_id]
+
+            if nearest and nearest[1] <= self.enter_radius_m:
+                self._drivers[driver_id] = _DriverState(nearest[0], ts)
+                events.append((ENTER, nearest[0], nearest[1]))
+            return events
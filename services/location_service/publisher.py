@@ -0,0 +1,105 @@
+"""
+Long-lived RabbitMQ publisher used by LocationService.
+
+Keeps one robust aio-pika connection and a publisher-confirms channel open
+instead of a TCP + AMQP handshake per message; aio-pika reconnects it
+transparently when the broker drops it. publish_batch() sends every message
+of a batch before waiting, so the broker's confirms for the whole batch
+arrive in one round trip. After a failure only the messages the broker has
+not confirmed are sent again.
+
+With partitions > 1 the queue is split into `<queue>.p<N>` and each event is
+routed by the hash of its partition_key field (see common_lib.partitioning).
+"""
+import asyncio
+import json
+import logging
+
+import aio_pika
+
+from services.common_lib.partitioning import PARTITION_QUEUE_ARGS, partition_queues, queue_for_key
+
+logger = logging.getLogger("location_service")
+
+RETRYABLE_ERRORS = (aio_pika.exceptions.AMQPException, aio_pika.exceptions.ChannelInvalidStateError, ConnectionError)
+
+
+class RabbitPublisher:
+    def __init__(self, url, queue, partitions=1, partition_key=None, retries=3, retry_backoff_s=0.2):
+        self.url = url
+        self.queue = queue
+        self.partitions = partitions if partition_key else 1
+        self.partition_key = partition_key
+        self.retries = retries
+        self.retry_backoff_s = retry_backoff_s
+        self._conn = None
+        self._ch = None
+        self._lock = asyncio.Lock()
+
+    async def _channel(self):
+        if self._conn is None:
+            self._conn = await aio_pika.connect_robust(self.url)
+        if self._ch is None or self._ch.is_closed:
+            self._ch = await self._conn.channel(publisher_confirms=True)
+            if self.partitions > 1:
+                for name in partition_queues(self.queue, self.partitions):
+                    await self._ch.declare_queue(name, durable=True, arguments=PARTITION_QUEUE_ARGS)
+            else:
+                await self._ch.declare_queue(self.queue, durable=True)
+            logger.info("Publisher connected for %s", self.queue)
+        return self._ch
+
+    def _routing_key(self, evt):
+        if self.partitions <= 1:
+            return self.queue
+        return queue_for_key(self.queue, evt[self.partition_key], self.partitions)
+
+    async def publish_batch(self, events):
+        """Publish JSON events and wait for the broker to confirm all of them."""
+        if not events:
+            return
+        messages = [
+            (
+                self._routing_key(evt),
+                aio_pika.Message(
+                    body=json.dumps(evt).encode(),
+                    content_type="application/json",
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                ),
+            )
+            for evt in events
+        ]
+        for attempt in range(1, self.retries + 1):
+            try:
+                async with self._lock:
+                    ch = await self._channel()
+                exchange = ch.default_exchange
+                results = await asyncio.gather(
+                    *(exchange.publish(m, routing_key=key) for key, m in messages), return_exceptions=True
+                )
+            except RETRYABLE_ERRORS as e:
+                error = e
+            else:
+                failed = [(msg, r) for msg, r in zip(messages, results) if isinstance(r, BaseException)]
+                if not failed:
+                    return
+                for _, r in failed:
+                    if not isinstance(r, RETRYABLE_ERRORS):
+                        raise r
+                # confirmed messages are not sent again (that would duplicate enter/dwell events)
+                messages = [msg for msg, _ in failed]
+                error = failed[0][1]
+            logger.warning(
+                "Publish to %s failed (attempt %d/%d, %d unconfirmed): %r",
+                self.queue, attempt, self.retries, len(messages), error,
+            )
+            self._ch = None
+            if attempt == self.retries:
+                raise error
+            await asyncio.sleep(self.retry_backoff_s * attempt)
+
+    async def close(self):
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+            self._ch = None
@@ -0,0 +1,235 @@
+"""
+In-memory station catalog for LocationService.
+
+Stations are bucketed into a fixed lat/lng grid so a nearest-station lookup
+only looks at the handful of cells around a point instead of scanning the
+whole `stations` table in PostGIS.
+
+On top of that the index keeps a proximity table: a map from fine cells
+(about 220 m across) to the stations within candidate_radius_m of any point
+in the cell. The table is maintained incrementally as stations are added,
+moved or removed. Most driver updates are nowhere near a station and are
+rejected with a single dict lookup; only the few candidates get exact
+haversine math. Queries wider than the table's radius evaluate batches of
+points against every station at once with NumPy (see nearest_batch).
+"""
+import math
+import threading
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEG_LAT = 111320.0
+# upper bound on points x stations evaluated in one NumPy pass (~16 MB of float64)
+BATCH_MATRIX_CELLS = 2_000_000
+
+
+def haversine_m(lat1, lng1, lat2, lng2):
+    """Great-circle distance in meters between two lat/lng points."""
+    p1 = math.radians(lat1)
+    p2 = math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+class StationIndex:
+    """Grid-bucketed station catalog answering nearest-station queries."""
+
+    def __init__(self, cell_deg=0.01, candidate_radius_m=0, candidate_cell_deg=0.002):
+        self.cell_deg = cell_deg
+        self.candidate_radius_m = candidate_radius_m
+        self.candidate_cell_deg = candidate_cell_deg
+        self.ready = False
+        self._stations = {}   # station_id -> (lat, lng)
+        self._cells = {}      # (row, col) -> set of station_ids
+        self._near = {}       # fine (row, col) -> set of station_ids within candidate_radius_m
+        self._arrays = None   # cached (ids, lat_rad, lng_rad, cos_lat) for nearest_batch
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._stations)
+
+    def _cell(self, lat, lng):
+        return (math.floor(lat / self.cell_deg), math.floor(lng / self.cell_deg))
+
+    def _put(self, station_id, lat, lng):
+        old = self._stations.get(station_id)
+        if old is not None:
+            self._drop(station_id, old)
+        self._stations[station_id] = (lat, lng)
+        self._cells.setdefault(self._cell(lat, lng), set()).add(station_id)
+        for cell in self._covering_cells(lat, lng):
+            self._near.setdefault(cell, set()).add(station_id)
+        self._arrays = None
+
+    def _drop(self, station_id, pos):
+        self._arrays = None
+        _discard(self._cells, self._cell(*pos), station_id)
+        for cell in self._covering_cells(*pos):
+            _discard(self._near, cell, station_id)
+
+    def _covering_cells(self, lat, lng):
+        """Fine cells containing any point within candidate_radius_m of (lat, lng)."""
+        if self.candidate_radius_m <= 0:
+            return
+        c = self.candidate_cell_deg
+        dlat = self.candidate_radius_m / METERS_PER_DEG_LAT
+        cos_lat = max(math.cos(math.radians(min(abs(lat) + dlat, 90.0))), 0.01)
+        dlng = self.candidate_radius_m / (METERS_PER_DEG_LAT * cos_lat)
+        for row in range(math.floor((lat - dlat) / c), math.floor((lat + dlat) / c) + 1):
+            for col in range(math.floor((lng - dlng) / c), math.floor((lng + dlng) / c) + 1):
+                yield (row, col)
+
+    def upsert(self, station_id, lat, lng):
+        with self._lock:
+            self._put(station_id, float(lat), float(lng))
+
+    def remove(self, station_id):
+        with self._lock:
+            pos = self._stations.pop(station_id, None)
+            if pos is not None:
+                self._drop(station_id, pos)
+
+    def sync(self, rows):
+        """
+        Bring the index in line with a full catalog listing of
+        (station_id, lat, lng) rows. Returns (added, moved, removed) counts.
+        """
+        fresh = {sid: (float(lat), float(lng)) for sid, lat, lng in rows}
+        added = moved = 0
+        with self._lock:
+            removed = [sid for sid in self._stations if sid not in fresh]
+            for sid in removed:
+                self._drop(sid, self._stations.pop(sid))
+            for sid, pos in fresh.items():
+                old = self._stations.get(sid)
+                if old == pos:
+                    continue
+                if old is None:
+                    added += 1
+                else:
+                    moved += 1
+                self._put(sid, *pos)
+            self.ready = True
+        return added, moved, len(removed)
+
+    def position(self, station_id):
+        return self._stations.get(station_id)
+
+    def distance_to(self, station_id, lat, lng):
+        pos = self._stations.get(station_id)
+        if pos is None:
+            return None
+        return haversine_m(lat, lng, pos[0], pos[1])
+
+    def nearest(self, lat, lng, max_distance_m):
+        """
+        Return (station_id, distance_m) of the closest station within
+        max_distance_m, or None. Rings of cells are searched outwards from the
+        point's own cell and the search stops as soon as no unvisited ring can
+        hold anything closer than the best match so far.
+        """
+        cos_lat = max(math.cos(math.radians(lat)), 0.01)
+        cell_m = self.cell_deg * METERS_PER_DEG_LAT * cos_lat
+        max_ring = int(math.ceil(max_distance_m / cell_m)) + 1
+        row0, col0 = self._cell(lat, lng)
+
+        best_id, best_d = None, max_distance_m
+        with self._lock:
+            for ring in range(max_ring + 1):
+                for cell in _ring_cells(row0, col0, ring):
+                    for sid in self._cells.get(cell, ()):
+                        slat, slng = self._stations[sid]
+                        d = haversine_m(lat, lng, slat, slng)
+                        if d <= best_d:
+                            best_id, best_d = sid, d
+                # every cell in ring k+1 is at least k cells away from the point
+                if best_id is not None and best_d <= ring * cell_m:
+                    break
+        if best_id is None:
+            return None
+        return best_id, best_d
+
+    def _station_arrays(self):
+        with self._lock:
+            if self._arrays is None:
+                ids = list(self._stations)
+                coords = np.radians(np.array([self._stations[sid] for sid in ids], dtype=np.float64).reshape(-1, 2))
+                self._arrays = (ids, coords[:, 0], coords[:, 1], np.cos(coords[:, 0]))
+            return self._arrays
+
+    def nearest_candidate(self, lat, lng, max_distance_m):
+        """nearest() for max_distance_m <= candidate_radius_m, via the proximity table."""
+        c = self.candidate_cell_deg
+        candidates = self._near.get((math.floor(lat / c), math.floor(lng / c)))
+        if not candidates:
+            return None
+        best_id, best_d = None, max_distance_m
+        with self._lock:
+            for sid in candidates:
+                slat, slng = self._stations[sid]
+                d = haversine_m(lat, lng, slat, slng)
+                if d <= best_d:
+                    best_id, best_d = sid, d
+        if best_id is None:
+            return None
+        return best_id, best_d
+
+    def nearest_batch(self, lats, lngs, max_distance_m):
+        """
+        nearest() for many points. Returns a list aligned with the input holding
+        (station_id, distance_m) or None per point. Within the proximity
+        table's radius each point costs one cell lookup; wider searches run a
+        vectorized haversine from every point to every station with NumPy.
+        """
+        if 0 < max_distance_m <= self.candidate_radius_m:
+            return [self.nearest_candidate(lat, lng, max_distance_m) for lat, lng in zip(lats, lngs)]
+
+        ids, s_lat, s_lng, s_cos = self._station_arrays()
+        n = len(lats)
+        if not ids or n == 0:
+            return [None] * n
+
+        p_lat = np.radians(np.asarray(lats, dtype=np.float64))
+        p_lng = np.radians(np.asarray(lngs, dtype=np.float64))
+        p_cos = np.cos(p_lat)
+
+        best_j = np.empty(n, dtype=np.intp)
+        best_a = np.empty(n, dtype=np.float64)
+        step = max(1, BATCH_MATRIX_CELLS // len(ids))
+        for lo in range(0, n, step):
+            hi = min(n, lo + step)
+            dlat = s_lat[None, :] - p_lat[lo:hi, None]
+            dlng = s_lng[None, :] - p_lng[lo:hi, None]
+            a = np.sin(dlat / 2) ** 2 + p_cos[lo:hi, None] * s_cos[None, :] * np.sin(dlng / 2) ** 2
+            j = np.argmin(a, axis=1)
+            best_j[lo:hi] = j
+            best_a[lo:hi] = a[np.arange(hi - lo), j]
+
+        dist = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(best_a, 0.0, 1.0)))
+        return [
+            (ids[j], float(d)) if d <= max_distance_m else None
+            for j, d in zip(best_j.tolist(), dist.tolist())
+        ]
+
+
+def _ring_cells(row0, col0, ring):
+    if ring == 0:
+        yield (row0, col0)
+        return
+    for col in range(col0 - ring, col0 + ring + 1):
+        yield (row0 - ring, col)
+        yield (row0 + ring, col)
+    for row in range(row0 - ring + 1, row0 + ring):
+        yield (row, col0 - ring)
+        yield (row, col0 + ring)
+
+
+def _discard(cells, cell, station_id):
+    bucket = cells.get(cell)
+    if bucket is not None:
+        bucket.discard(station_id)
+        if not bucket:
+            del cells[cell]
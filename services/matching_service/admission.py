@@ -0,0 +1,67 @@
+"""
+Admission control for MatchingService's driver.near_station consumers.
+
+During a flood of proximity events the consumers would otherwise match every
+event in order, however old, and latency for fresh events grows without
+bound. Two rules keep the work per event bounded:
+
+  - stale: an event whose ts is older than max_age_ms is acked without
+    matching (a newer event from the same driver will follow);
+  - collapsed: events buffered on a consumer channel are keyed by
+    (driver_id, station_id) and only the newest one per key is matched;
+    the ones it supersedes are acked straight away.
+
+ShedCounters counts both, for the /metrics endpoint.
+"""
+import threading
+
+
+def is_stale(event, now_ms, max_age_ms):
+    ts = event.get("ts")
+    return max_age_ms > 0 and bool(ts) and now_ms - ts > max_age_ms
+
+
+class ShedCounters:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+
+    def inc(self, reason, n=1):
+        with self._lock:
+            self._counts[reason] = self._counts.get(reason, 0) + n
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._counts)
+
+
+class PendingDriverEvents:
+    """
+    Collapse buffer for one consumer channel: (driver_id, station_id) ->
+    (delivery_tag, event), first-arrival order. Not thread-safe; each
+    consumer lane owns its buffer.
+    """
+
+    def __init__(self):
+        self._events = {}
+
+    def __len__(self):
+        return len(self._events)
+
+    def offer(self, delivery_tag, event):
+        """Buffer an event; returns the delivery tag it supersedes (or that it is superseded by), else None."""
+        key = (event["driver_id"], event["station_id"])
+        current = self._events.get(key)
+        if current is None:
+            self._events[key] = (delivery_tag, event)
+            return None
+        if (event.get("ts") or 0) < (current[1].get("ts") or 0):
+            # redelivered out of order: the buffered event is newer
+            return delivery_tag
+        self._events[key] = (delivery_tag, event)
+        return current[0]
+
+    def drain(self):
+        events = list(self._events.values())
+        self._events.clear()
+        return events
@@ -0,0 +1,155 @@
+"""
+Batch assignment of waiting riders to the drivers at one station.
+
+Used by MatchingService's batch-window mode: all drivers that reached a
+station within the window are matched together instead of first-come
+first-served. The problem is a min-cost assignment of riders to seat slots
+(one column per free seat of every driver), solved exactly with the
+Hungarian algorithm (shortest augmenting paths with potentials; the inner
+loop over columns is vectorized with NumPy).
+
+Costs are built so that, in order of priority, the solution
+  1. serves as many riders as possible,
+  2. prefers the longest-waiting riders,
+  3. fills earlier-arriving drivers first (and gives them the oldest riders).
+A rider can only take a seat of a driver whose destinations include the
+rider's destination and, when the driver has a departs_at, who arrives by
+then; incompatible pairs cost 0, i.e. the same as leaving the rider
+unassigned.
+"""
+import numpy as np
+
+
+def hungarian(cost):
+    """
+    Min-cost assignment for an n x m cost matrix with n <= m.
+    Returns col_of_row: array of length n with the column assigned to each row.
+    """
+    cost = np.asarray(cost, dtype=float)
+    n, m = cost.shape
+    if n > m:
+        raise ValueError("hungarian() needs rows <= columns")
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    row_of_col = np.zeros(m + 1, dtype=int)   # 1-based row per column, 0 = free; column 0 is virtual
+    for i in range(1, n + 1):
+        row_of_col[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        way = np.zeros(m + 1, dtype=int)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = row_of_col[j0]
+            free = ~used[1:]
+            # reduced costs from row i0 to every unused column
+            cur = cost[i0 - 1] - u[i0] - v[1:]
+            better = free & (cur < minv[1:])
+            minv[1:][better] = cur[better]
+            way[1:][better] = j0
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+            used_cols = np.flatnonzero(used)
+            u[row_of_col[used_cols]] += delta
+            v[used_cols] -= delta
+            minv[1:][free] -= delta
+            j0 = j1
+            if row_of_col[j0] == 0:
+                break
+        # walk the augmenting path back to the virtual column
+        while j0:
+            j1 = way[j0]
+            row_of_col[j0] = row_of_col[j1]
+            j0 = j1
+    col_of_row = np.empty(n, dtype=int)
+    for j in range(1, m + 1):
+        if row_of_col[j]:
+            col_of_row[row_of_col[j] - 1] = j - 1
+    return col_of_row
+
+
+def _prune(drivers, riders):
+    """
+    Only the longest-waiting riders of each destination can appear in an
+    optimal answer: at most (seats of drivers serving that destination) of them.
+    """
+    capacity = {}
+    for d in drivers:
+        for dest in d["destinations"]:
+            capacity[dest] = capacity.get(dest, 0) + d["seats"]
+    kept, taken = [], {}
+    for r in sorted(riders, key=lambda r: r["arrival_time"]):
+        dest = r["destination"]
+        if taken.get(dest, 0) < capacity.get(dest, 0):
+            taken[dest] = taken.get(dest, 0) + 1
+            kept.append(r)
+    return kept
+
+
+def assign_riders(drivers, riders):
+    """
+    drivers: list of {"driver_id", "seats", "destinations", "departs_at"} in
+      arrival order; departs_at is optional (None = no arrival cutoff).
+    riders: rider dicts ({"rider_id", "destination", "arrival_time", ...}).
+    Returns {driver_id: [rider, ...]} for drivers that got at least one rider.
+    """
+    drivers = [d for d in drivers if d["seats"] > 0]
+    riders = _prune(drivers, riders)
+    if not drivers or not riders:
+        return {}
+
+    slot_driver = np.repeat(np.arange(len(drivers)), [d["seats"] for d in drivers])
+    rider_dest = [r["destination"] for r in riders]
+    dests = sorted(set(rider_dest))
+    dest_idx = {dest: k for k, dest in enumerate(dests)}
+    # compat[k, d]: driver d serves destination k
+    compat = np.zeros((len(dests), len(drivers)), dtype=bool)
+    for d, drv in enumerate(drivers):
+        for dest in drv["destinations"]:
+            if dest in dest_idx:
+                compat[dest_idx[dest], d] = True
+    allowed = compat[np.array([dest_idx[x] for x in rider_dest])][:, slot_driver]   # riders x slots
+
+    arrival = np.array([r["arrival_time"] for r in riders], dtype=float)
+    departs = np.array([np.inf if d.get("departs_at") is None else d["departs_at"] for d in drivers], dtype=float)
+    allowed &= arrival[:, None] <= departs[slot_driver][None, :]
+    span = arrival.max() - arrival.min()
+    # 0 for the newest rider, 1 for the oldest
+    seniority = (arrival.max() - arrival) / span if span else np.zeros(len(riders))
+    driver_rank = slot_driver / max(len(drivers) - 1, 1)
+    big = len(riders) + 1   # one more rider served outweighs any seniority trade-off
+    cost = -(big + seniority)[:, None] + 1e-3 * driver_rank[None, :]
+    # tie-break: the oldest riders ride with the earliest drivers
+    cost += 1e-6 * seniority[:, None] * driver_rank[None, :]
+    cost = np.where(allowed, cost, 0.0)
+
+    if cost.shape[0] <= cost.shape[1]:
+        pairs = enumerate(hungarian(cost))
+    else:
+        pairs = ((r, s) for s, r in enumerate(hungarian(cost.T)))
+
+    result = {}
+    for r, s in pairs:
+        if allowed[r, s]:
+            result.setdefault(drivers[slot_driver[s]]["driver_id"], []).append(riders[r])
+    for matched in result.values():
+        matched.sort(key=lambda r: r["arrival_time"])
+    return result
+
+
+def assign_greedy(drivers, riders):
+    """First-come first-served baseline: each driver in turn takes the oldest compatible riders."""
+    left = sorted(riders, key=lambda r: r["arrival_time"])
+    result = {}
+    for d in drivers:
+        departs_at = d.get("departs_at")
+        take = [
+            r for r in left
+            if r["destination"] in d["destinations"] and (departs_at is None or r["arrival_time"] <= departs_at)
+        ][:max(d["seats"], 0)]
+        if take:
+            result[d["driver_id"]] = take
+            taken = {id(r) for r in take}
+            left = [r for r in left if id(r) not in taken]
+    return result
@@ -0,0 +1,68 @@
+"""
+Bounded dedup set for MatchingService's rider-request ingestion.
+
+An insertion-ordered dict of key -> first-seen time: lookups and inserts are
+O(1), and the oldest keys are evicted from the front once they are older
+than ttl_s or the set holds more than max_entries, so memory stays bounded
+however long the service runs. export()/restore() carry the keys and their
+ages through a MatchingService snapshot. Thread-safe.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class DedupCache:
+    def __init__(self, ttl_s=3600, max_entries=200000):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.duplicates = 0
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._seen)
+
+    def _evict(self, now):
+        cutoff = now - self.ttl_s
+        while self._seen:
+            key, ts = next(iter(self._seen.items()))
+            if ts >= cutoff and len(self._seen) < self.max_entries:
+                break
+            self._seen.popitem(last=False)
+
+    def check_and_add(self, key):
+        """True if key is new (and now remembered), False for a duplicate."""
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            if key in self._seen:
+                self.duplicates += 1
+                return False
+            self._seen[key] = now
+            return True
+
+    def add(self, key):
+        with self._lock:
+            if key not in self._seen:
+                self._seen[key] = time.monotonic()
+
+    def discard(self, key):
+        with self._lock:
+            self._seen.pop(key, None)
+
+    def export(self):
+        """[[key..., age_s], ...] oldest first; ages survive a restart, monotonic times do not."""
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            return [[*key, round(now - ts, 3)] for key, ts in self._seen.items()]
+
+    def restore(self, entries):
+        now = time.monotonic()
+        with self._lock:
+            for *key, age_s in entries:
+                key = tuple(key)
+                self._seen.pop(key, None)
+                self._seen[key] = now - age_s
+            self._evict(now)
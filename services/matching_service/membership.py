@@ -0,0 +1,118 @@
+"""
+Replica membership for station-sharded MatchingService.
+
+Runs on its own thread and BlockingConnection: every replica publishes a
+heartbeat on a fanout exchange and listens on an exclusive queue bound to
+it, so each replica knows which replicas are alive. A replica that misses
+MEMBER_EXPIRY_BEATS heartbeats is dropped; one shutting down cleanly says so
+with a "leave" message (leave()), so its partitions move at once. Heartbeats
+carry the replica's gRPC address, so calls for a station can be forwarded to
+its owner. on_change(members) is called on this thread whenever the live set
+changes; members() and address_of() may be called from any thread.
+"""
+import json
+import logging
+import threading
+import time
+
+import pika
+
+logger = logging.getLogger("matching_service")
+
+MEMBER_EXPIRY_BEATS = 3
+
+
+class ReplicaMembership(threading.Thread):
+    def __init__(self, url, exchange, member_id, heartbeat_s, on_change, address=None):
+        super().__init__(daemon=True, name="membership")
+        self.url = url
+        self.exchange = exchange
+        self.member_id = member_id
+        self.heartbeat_s = heartbeat_s
+        self.on_change = on_change
+        self.address = address
+        self._lock = threading.Lock()   # _last_seen / _addresses, read by gRPC threads
+        self._last_seen = {}
+        self._addresses = {member_id: address}
+        self._published = set()
+        self._conn = None
+        self._ch = None
+        self._left = threading.Event()
+
+    def members(self):
+        with self._lock:
+            return set(self._last_seen)
+
+    def address_of(self, member):
+        with self._lock:
+            return self._addresses.get(member)
+
+    def leave(self, timeout=2):
+        """Tell the other replicas we are going, so they take our partitions now."""
+        conn = self._conn
+        if conn is None:
+            return
+        try:
+            conn.add_callback_threadsafe(lambda: self._announce("leave"))
+        except pika.exceptions.AMQPError:
+            return
+        self._left.wait(timeout)
+
+    def run(self):
+        while True:
+            try:
+                self._run_connected()
+            except pika.exceptions.AMQPError as e:
+                logger.warning(f"[SHARD] Membership connection lost: {e!r}, reconnecting")
+                time.sleep(self.heartbeat_s)
+
+    def _run_connected(self):
+        self._conn = pika.BlockingConnection(pika.URLParameters(self.url))
+        self._ch = self._conn.channel()
+        self._ch.exchange_declare(exchange=self.exchange, exchange_type="fanout")
+        queue = self._ch.queue_declare(queue="", exclusive=True, auto_delete=True).method.queue
+        self._ch.queue_bind(queue=queue, exchange=self.exchange)
+        self._ch.basic_consume(queue, self._on_message, auto_ack=True)
+
+        with self._lock:
+            self._last_seen = {self.member_id: time.monotonic()}
+        self._announce()
+        # collect the other replicas' heartbeats before claiming anything
+        self._conn.process_data_events(time_limit=self.heartbeat_s * 1.5)
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                self._last_seen[self.member_id] = now
+                for member in [m for m, seen in self._last_seen.items() if now - seen > self.heartbeat_s * MEMBER_EXPIRY_BEATS]:
+                    del self._last_seen[member]
+            members = self.members()
+            if members != self._published:
+                self._published = members
+                logger.info(f"[SHARD] Live replicas: {sorted(members)}")
+                try:
+                    self.on_change(members)
+                except Exception:
+                    logger.exception("Rebalance failed")
+            self._announce()
+            self._conn.process_data_events(time_limit=self.heartbeat_s)
+
+    def _announce(self, kind="heartbeat"):
+        if self._left.is_set():
+            return   # on our way out: don't undo the leave
+        body = json.dumps({"member": self.member_id, "kind": kind, "address": self.address})
+        self._ch.basic_publish(exchange=self.exchange, routing_key="", body=body)
+        if kind == "leave":
+            self._left.set()
+
+    def _on_message(self, ch, method, props, body):
+        data = json.loads(body)
+        member = data.get("member")
+        if not member or member == self.member_id:
+            return
+        with self._lock:
+            if data.get("kind") == "leave":
+                self._last_seen.pop(member, None)
+                self._addresses.pop(member, None)
+            else:
+                self._last_seen[member] = time.monotonic()
+                self._addresses[member] = data.get("address")
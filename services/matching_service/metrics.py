@@ -0,0 +1,49 @@
+"""
+Minimal Prometheus-style /metrics endpoint for MatchingService.
+
+collect() returns (name, labels, value) samples; they are rendered in the
+Prometheus text format on every scrape. /ready answers 200 or 503 from
+ready() (for a readiness probe). Standard library only, served from one
+daemon thread.
+"""
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger("matching_service")
+
+
+def render(samples):
+    lines = []
+    for name, labels, value in samples:
+        label_str = ",".join(f'{k}="{v}"' for k, v in labels.items())
+        lines.append(f"{name}{{{label_str}}} {value}" if label_str else f"{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def start_metrics_server(port, collect, ready=None):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/ready":
+                ok = ready is None or ready()
+                self.send_response(200 if ok else 503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = render(collect()).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True, name="metrics").start()
+    logger.info(f"Metrics on :{port}/metrics")
+    return server
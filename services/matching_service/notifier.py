@@ -0,0 +1,70 @@
+"""
+Asynchronous notification fan-out for MatchingService.
+
+submit() only puts the Notification on a bounded in-process queue and never
+blocks: when the queue is full the notification is dropped and counted, so a
+slow or unreachable NotificationService cannot stall matching. A small pool
+of worker threads drains the queue in batches, each batch sent as one
+StreamNotifications call over a single long-lived gRPC channel.
+"""
+import logging
+import queue
+import threading
+import time
+
+import grpc
+
+from services.common_lib.protos_generated import notification_pb2_grpc
+
+logger = logging.getLogger("matching_service")
+
+
+class Notifier:
+    def __init__(self, target, workers=2, queue_size=10000, batch_size=50, batch_wait_ms=20, timeout_s=5):
+        self.target = target
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_wait_s = batch_wait_ms / 1000
+        self.timeout_s = timeout_s
+        self.dropped = 0
+        self.failed = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._channel = grpc.insecure_channel(target)
+        self._stub = notification_pb2_grpc.NotificationServiceStub(self._channel)
+
+    def start(self):
+        for i in range(self.workers):
+            threading.Thread(target=self._run, daemon=True, name=f"notifier-{i}").start()
+
+    def submit(self, notification):
+        try:
+            self._queue.put_nowait(notification)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning("Notification queue full, dropped %d so far", self.dropped)
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.batch_wait_s
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                acks = self._stub.StreamNotifications(iter(batch), timeout=self.timeout_s)
+                failed = sum(1 for ack in acks if not ack.ok)
+            except grpc.RpcError as e:
+                failed = len(batch)
+                logger.warning("NotificationService failed for %d notifications: %s", len(batch), e.code())
+            self.failed += failed
@@ -0,0 +1,208 @@
+"""
+Hot-standby replication for MatchingService.
+
+Leader side, ReplicationHub: every state change that goes through record()
+is also published here with a sequence number. A standby subscribing through
+the StreamState RPC gets the ops it missed from a bounded backlog, or a full
+snapshot if it is new, behind the backlog or was following an earlier
+leader process (epoch). After that it gets every op live, plus a heartbeat
+whenever the leader has been idle for heartbeat_s. A standby that cannot
+keep up is cut off and resyncs.
+
+Standby side, StandbyFollower: applies the stream through on_snapshot /
+on_op and holds the lease while deltas keep arriving. Once nothing has
+arrived for lease_ms it checks the peer's Health. If the peer is not
+reachable as a leader, run() returns and the caller takes over; the standby's
+state is current, so no queue replay is needed.
+
+LeaderLease: a replica only leads while it holds an exclusive RabbitMQ
+queue, which the broker gives to one connection at a time and drops with
+that connection. Two replicas that both find the other not (yet) leading
+race for it; the loser goes back to following. A holder whose broker
+connection fails has lost the lease and must stop leading.
+"""
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+
+import grpc
+import pika
+from google.protobuf import empty_pb2
+
+from services.common_lib.protos_generated import matching_pb2, matching_pb2_grpc
+
+logger = logging.getLogger("matching_service")
+
+
+class _Subscriber:
+    def __init__(self, queue_size):
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.lagging = False
+
+
+class ReplicationHub:
+    def __init__(self, lock, backlog=100000, queue_size=100000):
+        self.epoch = uuid.uuid4().hex
+        self.seq = 0
+        self._lock = lock          # the state lock record() holds around publish()
+        self._backlog = deque(maxlen=backlog)
+        self._queue_size = queue_size
+        self._subscribers = set()
+
+    def standbys(self):
+        return len(self._subscribers)
+
+    def publish(self, op):
+        """Called with the state lock held, so seq order is apply order."""
+        self.seq += 1
+        self._backlog.append((self.seq, op))
+        for sub in list(self._subscribers):
+            try:
+                sub.queue.put_nowait((self.seq, op))
+            except queue.Full:
+                sub.lagging = True
+                self._subscribers.discard(sub)
+
+    def subscribe(self, epoch, after_seq, capture):
+        """Returns (subscriber, snapshot_or_None, seq, backlog ops to send first)."""
+        sub = _Subscriber(self._queue_size)
+        with self._lock:
+            resumable = epoch == self.epoch and (
+                after_seq == self.seq or (self._backlog and self._backlog[0][0] <= after_seq + 1 <= self.seq)
+            )
+            if resumable:
+                snapshot, missed = None, [(s, op) for s, op in self._backlog if s > after_seq]
+            else:
+                snapshot, missed = capture(), []
+            seq = self.seq
+            self._subscribers.add(sub)
+        return sub, snapshot, seq, missed
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    def deltas(self, sub, seq, heartbeat_s):
+        """
+        (seq, op) for every op after subscribing at seq; (seq, None)
+        heartbeats, with the seq of the last op sent, while idle.
+        """
+        while not sub.lagging:
+            try:
+                seq, op = sub.queue.get(timeout=heartbeat_s)
+            except queue.Empty:
+                op = None
+            yield seq, op
+
+
+class StandbyFollower:
+    def __init__(self, target, standby_id, lease_ms, on_snapshot, on_op, retry_s=1):
+        self.target = target
+        self.standby_id = standby_id
+        self.lease_ms = lease_ms
+        self.on_snapshot = on_snapshot
+        self.on_op = on_op
+        self.retry_s = retry_s
+        self.epoch = ""
+        self.seq = 0
+        self.leader_id = None
+        # a leader starting alongside us gets a few leases to come up first
+        self._last_delta = time.monotonic() + 2 * lease_ms / 1000
+        self._call = None
+        self._done = False
+        # a snapshot of a busy leader is well over gRPC's default 4 MB
+        self._channel = grpc.insecure_channel(target, options=[("grpc.max_receive_message_length", -1)])
+        self._stub = matching_pb2_grpc.MatchingServiceStub(self._channel)
+
+    def run(self):
+        """Follow the leader; returns once its lease has expired and it is not reachable as leader."""
+        threading.Thread(target=self._watchdog, daemon=True, name="standby-watchdog").start()
+        while True:
+            try:
+                self._follow()
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.CANCELLED:
+                    logger.warning(f"[STANDBY] Replication stream from {self.target} ended: {e.code().name}")
+            except Exception:
+                # e.g. a gap in seq: start over from a snapshot
+                logger.exception("[STANDBY] Replication stream broken, resyncing")
+                self.epoch, self.seq = "", 0
+            if self._lease_expired() and not self.peer_is_leader():
+                logger.warning(f"[STANDBY] Leader {self.leader_id or self.target} lease expired, taking over")
+                self._done = True
+                self._channel.close()
+                return
+            time.sleep(self.retry_s)
+
+    def _follow(self):
+        self._call = self._stub.StreamState(
+            matching_pb2.ReplicationRequest(standby_id=self.standby_id, epoch=self.epoch, after_seq=self.seq)
+        )
+        for delta in self._call:
+            self._last_delta = time.monotonic()
+            self.lease_ms = delta.lease_ms or self.lease_ms
+            self.leader_id = delta.leader_id or self.leader_id
+            if delta.snapshot:
+                self.on_snapshot(json.loads(delta.snapshot))
+                logger.info(f"[STANDBY] Synced snapshot from {self.leader_id} at seq {delta.seq}")
+            elif delta.op:
+                if delta.epoch != self.epoch or delta.seq != self.seq + 1:
+                    raise RuntimeError(f"replication gap: have {self.epoch}/{self.seq}, got {delta.epoch}/{delta.seq}")
+                self.on_op(json.loads(delta.op))
+            elif delta.epoch != self.epoch or delta.seq != self.seq:
+                raise RuntimeError(f"replication gap: have {self.epoch}/{self.seq}, heartbeat at {delta.epoch}/{delta.seq}")
+            self.epoch, self.seq = delta.epoch, delta.seq
+
+    def _lease_expired(self):
+        return (time.monotonic() - self._last_delta) * 1000 > self.lease_ms
+
+    def _watchdog(self):
+        # a leader that hangs without closing the stream must still lose its lease
+        while not self._done:
+            time.sleep(self.lease_ms / 4000)
+            call = self._call
+            if call is not None and self._lease_expired():
+                call.cancel()
+
+    def peer_is_leader(self):
+        try:
+            resp = self._stub.Health(empty_pb2.Empty(), timeout=1)
+            return resp.reason == "leader"
+        except grpc.RpcError:
+            return False
+
+
+class LeaderLease:
+    def __init__(self, url, name, on_lost):
+        self.url = url
+        self.queue = f"matching.leader.{name}"
+        self.on_lost = on_lost
+        self._conn = None
+
+    def try_acquire(self):
+        """True if we now hold the lease (keep it by calling hold()); False if another replica does."""
+        conn = pika.BlockingConnection(pika.URLParameters(self.url))
+        try:
+            conn.channel().queue_declare(queue=self.queue, exclusive=True)
+        except pika.exceptions.ChannelClosedByBroker as e:
+            conn.close()
+            if e.reply_code == 405:   # RESOURCE_LOCKED: declared exclusive by another connection
+                return False
+            raise
+        self._conn = conn
+        return True
+
+    def hold(self):
+        threading.Thread(target=self._keep, daemon=True, name="leader-lease").start()
+
+    def _keep(self):
+        try:
+            while True:
+                self._conn.process_data_events(time_limit=1)
+        except Exception as e:
+            logger.error(f"[LEASE] Lost the leader lease {self.queue}: {e!r}")
+            self.on_lost()
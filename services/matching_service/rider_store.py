@@ -0,0 +1,145 @@
+"""
+Waiting-rider store for MatchingService.
+
+Riders are bucketed by (station_id, destination). Each bucket keeps its
+riders sorted by arrival_time (ties in request order) next to a
+rider_id -> rider dict, so a driver event finds the riders that reach the
+station before it leaves with one binary search and only touches the riders
+it actually takes, instead of scanning the station's whole list.
+"""
+import bisect
+import heapq
+import itertools
+from itertools import islice
+
+
+class _ArrivalQueue:
+    """One bucket: riders ordered by (arrival_time, request order)."""
+
+    __slots__ = ("keys", "riders")
+
+    def __init__(self):
+        self.keys = []      # sorted (arrival_time, seq, rider_id)
+        self.riders = {}    # rider_id -> (key, rider)
+
+    def __len__(self):
+        return len(self.riders)
+
+    def add(self, rider, seq):
+        key = (rider["arrival_time"], seq, rider["rider_id"])
+        bisect.insort(self.keys, key)
+        self.riders[rider["rider_id"]] = (key, rider)
+
+    def pop(self, rider_id):
+        key, rider = self.riders.pop(rider_id)
+        del self.keys[bisect.bisect_left(self.keys, key)]
+        return rider
+
+    def get(self, rider_id):
+        return self.riders[rider_id][1]
+
+    def first(self, n, until=None):
+        """Up to n earliest riders, only those arriving at or before `until` if given."""
+        end = len(self.keys) if until is None else bisect.bisect_right(self.keys, (until, float("inf")))
+        return [self.riders[key[2]][1] for key in self.keys[:min(n, end)]]
+
+    def values(self):
+        return (self.riders[key[2]][1] for key in self.keys)
+
+
+class WaitingRiderStore:
+    def __init__(self):
+        self._buckets = {}    # (station_id, destination) -> _ArrivalQueue
+        self._stations = {}   # station_id -> set of destinations with waiting riders
+        self._where = {}      # rider_id -> (station_id, destination)
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, rider_id):
+        return rider_id in self._where
+
+    def add(self, station_id, rider):
+        """Queue a rider at a station; a rider already waiting elsewhere is moved."""
+        rider_id = rider["rider_id"]
+        self.remove(rider_id)
+        key = (station_id, rider["destination"])
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _ArrivalQueue()
+        bucket.add(rider, next(self._seq))
+        self._stations.setdefault(station_id, set()).add(rider["destination"])
+        self._where[rider_id] = key
+
+    def remove(self, rider_id):
+        """Remove a waiting rider; returns the rider or None."""
+        key = self._where.pop(rider_id, None)
+        if key is None:
+            return None
+        bucket = self._buckets[key]
+        rider = bucket.pop(rider_id)
+        if not bucket:
+            del self._buckets[key]
+            station_id, destination = key
+            dests = self._stations[station_id]
+            dests.discard(destination)
+            if not dests:
+                del self._stations[station_id]
+        return rider
+
+    def remove_many(self, rider_ids):
+        return [r for r in (self.remove(rid) for rid in rider_ids) if r is not None]
+
+    def peek(self, station_id, destination, n, until=None):
+        """Up to n earliest-arriving riders at station_id heading to destination (arriving by `until`)."""
+        bucket = self._buckets.get((station_id, destination))
+        if bucket is None or n <= 0:
+            return []
+        return bucket.first(n, until)
+
+    def peek_any(self, station_id, destinations, n, until=None):
+        """
+        Up to n earliest-arriving riders at station_id heading to any of
+        destinations, only those arriving at or before `until` if given:
+        only the buckets for those destinations are visited, each cut with
+        a binary search, merged by arrival_time.
+        """
+        dests = self._stations.get(station_id)
+        if not dests or n <= 0:
+            return []
+        keys = [(station_id, d) for d in dests.intersection(destinations)]
+        if len(keys) == 1:
+            return self._buckets[keys[0]].first(n, until)
+        merged = heapq.merge(*(self._buckets[k].first(n, until) for k in keys), key=lambda r: r["arrival_time"])
+        return list(islice(merged, n))
+
+    def get(self, rider_id):
+        key = self._where.get(rider_id)
+        return self._buckets[key].get(rider_id) if key else None
+
+    def station_of(self, rider_id):
+        key = self._where.get(rider_id)
+        return key[0] if key else None
+
+    def has_station(self, station_id):
+        return station_id in self._stations
+
+    def destinations_at(self, station_id):
+        return set(self._stations.get(station_id, ()))
+
+    def count_at(self, station_id):
+        return sum(len(self._buckets[(station_id, d)]) for d in self._stations.get(station_id, ()))
+
+    def stations(self):
+        return list(self._stations)
+
+    def riders_at(self, station_id):
+        """All riders waiting at a station, per destination in arrival order."""
+        return [r for d in self._stations.get(station_id, ()) for r in self._buckets[(station_id, d)].values()]
+
+    def items(self):
+        """(station_id, rider) for every waiting rider."""
+        for (station_id, _), bucket in self._buckets.items():
+            for rider in bucket.values():
+                yield station_id, rider
@@ -0,0 +1,46 @@
+"""
+Driver routes for route-aware matching.
+
+DriverService publishes each driver's planned station list (driver.routes).
+For every route the index precomputes, per stop, the set of destinations a
+rider boarding there can be dropped at: every later stop plus the driver's
+final destination. A driver event at a station then needs one dict lookup to
+get its compatible destinations, independent of route length or of how many
+riders are waiting.
+"""
+
+
+class RouteIndex:
+    def __init__(self):
+        self._routes = {}        # driver_id -> {"route_id", "station_ids", "destination"}
+        self._downstream = {}    # driver_id -> {station_id: frozenset(destinations)}
+
+    def __len__(self):
+        return len(self._routes)
+
+    def update(self, driver_id, route_id, station_ids, destination):
+        self.remove(driver_id)
+        station_ids = list(station_ids)
+        self._routes[driver_id] = {"route_id": route_id, "station_ids": station_ids, "destination": destination}
+        downstream = {}
+        reachable = {destination} if destination else set()
+        # walk the route backwards so each stop's set is the one after it plus that stop
+        for station_id in reversed(station_ids):
+            downstream.setdefault(station_id, frozenset(reachable))
+            reachable.add(station_id)
+        self._downstream[driver_id] = downstream
+
+    def remove(self, driver_id):
+        if self._routes.pop(driver_id, None) is not None:
+            del self._downstream[driver_id]
+
+    def route_of(self, driver_id):
+        return self._routes.get(driver_id)
+
+    def downstream(self, driver_id, station_id):
+        """Destinations served from station_id, or None if the station is not on the driver's route."""
+        stops = self._downstream.get(driver_id)
+        return stops.get(station_id) if stops else None
+
+    def items(self):
+        return self._routes.items()
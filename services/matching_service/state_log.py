@@ -0,0 +1,109 @@
+"""
+Write-ahead log + snapshots for MatchingService's in-memory state.
+
+Every state change is appended as one JSON line (with a sequence number) to
+the current WAL segment `wal.<first_seq>` before the triggering message is
+acked. A snapshot captures the full state at some seq and starts a new
+segment; once the snapshot file is safely written, older segments are
+deleted. Recovery loads the snapshot and replays only the ops after its seq,
+so restart time depends on state size plus the log tail, not on history.
+"""
+import json
+import logging
+import os
+
+logger = logging.getLogger("matching_service")
+
+SNAPSHOT_FILE = "snapshot.json"
+SEGMENT_PREFIX = "wal."
+
+
+class StateLog:
+    def __init__(self, directory, fsync=False):
+        self.directory = directory
+        self.fsync = fsync
+        self.seq = 0
+        self.ops_since_snapshot = 0
+        self._file = None
+        self._segment = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _segments(self):
+        names = [n for n in os.listdir(self.directory) if n.startswith(SEGMENT_PREFIX)]
+        return sorted(names, key=lambda n: int(n[len(SEGMENT_PREFIX):]))
+
+    def load(self):
+        """
+        Return (snapshot_state_or_None, ops_after_snapshot) and position the
+        log after the last recovered op. Call once, before any append().
+        """
+        state, snap_seq = None, 0
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        if os.path.exists(path):
+            with open(path) as f:
+                snap = json.load(f)
+            state, snap_seq = snap["state"], snap["seq"]
+        self.seq = snap_seq
+
+        ops = []
+        for name in self._segments():
+            with open(os.path.join(self.directory, name)) as f:
+                for line in f:
+                    try:
+                        op = json.loads(line)
+                    except ValueError:
+                        logger.warning("Skipping torn WAL record in %s", name)
+                        continue
+                    if op["seq"] > snap_seq:
+                        ops.append(op)
+                        self.seq = op["seq"]
+        self.ops_since_snapshot = len(ops)
+        self._open_segment()
+        return state, ops
+
+    def _open_segment(self):
+        name = f"{SEGMENT_PREFIX}{self.seq + 1:012d}"
+        if self._file is not None:
+            if name == self._segment:
+                return   # nothing appended since this segment was opened
+            self._file.close()
+        self._segment = name
+        self._file = open(os.path.join(self.directory, name), "a", buffering=1)
+
+    def append(self, op):
+        self.seq += 1
+        self.ops_since_snapshot += 1
+        op["seq"] = self.seq
+        self._file.write(json.dumps(op, separators=(",", ":")) + "\n")
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def begin_snapshot(self):
+        """
+        Cut the log at the current seq. Must be called while state is frozen
+        (under the caller's state lock), right after capturing the state.
+        Returns a token for finish_snapshot().
+        """
+        seq = self.seq
+        self._open_segment()
+        old_segments = [n for n in self._segments() if n != self._segment]
+        self.ops_since_snapshot = 0
+        return seq, old_segments
+
+    def finish_snapshot(self, token, state):
+        """Persist the captured state and drop the segments it covers (no lock needed)."""
+        seq, old_segments = token
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"seq": seq, "state": state}, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        for name in old_segments:
+            os.remove(os.path.join(self.directory, name))
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,28 @@
+"""
+Per-station locking for MatchingService's concurrent consumers.
+
+Events for the same station are serialized, events for different stations
+run in parallel. Locks are striped (station_id hashes to one of `stripes`
+locks), so memory stays constant however many stations exist; two stations
+sharing a stripe only costs some parallelism. hold() takes several stripes
+in index order, so callers that need two stations cannot deadlock.
+"""
+import threading
+import zlib
+from contextlib import ExitStack, contextmanager
+
+
+class StationLocks:
+    def __init__(self, stripes=256):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def _stripe(self, station_id):
+        return zlib.crc32(station_id.encode()) % len(self._locks)
+
+    @contextmanager
+    def hold(self, *station_ids):
+        stripes = sorted({self._stripe(s) for s in station_ids if s is not None})
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(self._locks[stripe])
+            yield
@@ -0,0 +1,107 @@
+"""
+Hierarchical timing wheel for MatchingService's rider-request expiry.
+
+Level 0 has `wheel_size` slots of `tick_ms` each; every level above covers
+wheel_size times the span of the one below. schedule() and cancel() are O(1)
+(dict + set operations). advance() walks the elapsed ticks: each tick pops
+one level-0 slot, and whenever a lower wheel wraps around, the next slot of
+the level above is cascaded down, re-filed by its exact deadline. Deadlines
+beyond the top level's span wait in its furthest slot and are re-filed on
+cascade (or, with a single level, when their slot comes round), so any
+deadline works and no key fires before it is due. Not thread-safe; callers
+serialize access.
+"""
+
+
+class TimingWheel:
+    def __init__(self, now_ms, tick_ms=1000, wheel_size=64, levels=3):
+        self.tick_ms = tick_ms
+        self.wheel_size = wheel_size
+        self.levels = levels
+        self._tick = now_ms // tick_ms                  # last processed tick
+        self._slots = [[set() for _ in range(wheel_size)] for _ in range(levels)]
+        self._where = {}                                # key -> (level, slot)
+        self._deadline = {}                             # key -> deadline tick
+        self._due = set()                               # deadline already passed when scheduled
+
+    def __len__(self):
+        return len(self._deadline)
+
+    def __contains__(self, key):
+        return key in self._deadline
+
+    def schedule(self, key, deadline_ms):
+        """(Re)schedule key to expire at deadline_ms."""
+        self.cancel(key)
+        self._deadline[key] = deadline_ms // self.tick_ms
+        self._file(key)
+
+    def cancel(self, key):
+        if self._deadline.pop(key, None) is None:
+            return
+        where = self._where.pop(key, None)
+        if where is None:
+            self._due.discard(key)
+        else:
+            self._slots[where[0]][where[1]].discard(key)
+
+    def _file(self, key):
+        deadline = self._deadline[key]
+        delta = deadline - self._tick
+        if delta <= 0:
+            self._due.add(key)
+            return
+        span = 1
+        for level in range(self.levels):
+            if delta < span * self.wheel_size or level == self.levels - 1:
+                # too far for the top level: park in its furthest slot
+                target = min(deadline, self._tick + span * (self.wheel_size - 1))
+                slot = (target // span) % self.wheel_size
+                self._slots[level][slot].add(key)
+                self._where[key] = (level, slot)
+                return
+            span *= self.wheel_size
+
+    def advance(self, now_ms):
+        """Move the wheel to now_ms; returns the keys that expired."""
+        expired = list(self._due)
+        self._due.clear()
+        for key in expired:
+            del self._deadline[key]
+        now_tick = now_ms // self.tick_ms
+        while self._tick < now_tick:
+            if not self._deadline:
+                self._tick = now_tick
+                break
+            self._tick += 1
+            self._cascade()
+            slot = self._slots[0][self._tick % self.wheel_size]
+            keys = list(slot)
+            slot.clear()
+            for key in keys:
+                del self._where[key]
+                if self._deadline[key] > self._tick:
+                    # parked here because it was beyond the top level's span
+                    self._file(key)
+                else:
+                    del self._deadline[key]
+                    expired.append(key)
+        return expired
+
+    def _cascade(self):
+        span = 1
+        for level in range(1, self.levels):
+            span *= self.wheel_size
+            if self._tick % span:
+                return
+            slot = self._slots[level][(self._tick // span) % self.wheel_size]
+            keys = list(slot)
+            slot.clear()
+            for key in keys:
+                del self._where[key]
+                self._file(key)
+            # re-filed keys that are due now land in _due; fold them in below
+            for key in [k for k in keys if k in self._due]:
+                self._due.discard(key)
+                self._slots[0][self._tick % self.wheel_size].add(key)
+                self._where[key] = (0, self._tick % self.wheel_size)
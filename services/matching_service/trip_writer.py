@@ -0,0 +1,121 @@
+"""
+Deferred trip persistence for MatchingService.
+
+Matches carry a trip_id generated locally (common_lib.ids), so the trip row
+can be written after match.found has gone out. submit() queues the trip and
+returns immediately; worker threads send CreateTrip over one long-lived gRPC
+channel and retry with capped exponential backoff. CreateTrip is idempotent
+on trip_id, so a retry after a lost response (or a replay after restart)
+cannot create a duplicate. on_saved(trip_id) is called from a worker thread
+once a trip is stored.
+
+Transient gRPC failures and rejections (ok=False, which TripService also
+returns while its database is down) are retried up to max_attempts times;
+non-retryable gRPC codes and unexpected errors fail at once.
+on_failed(trip, reason) is then called so the trip can be dead-lettered.
+"""
+import logging
+import queue
+import threading
+import time
+
+import grpc
+
+from services.common_lib.protos_generated import trip_pb2, trip_pb2_grpc
+
+logger = logging.getLogger("matching_service")
+
+RETRYABLE_CODES = {
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+    grpc.StatusCode.ABORTED,
+    grpc.StatusCode.INTERNAL,
+    grpc.StatusCode.UNKNOWN,
+}
+
+
+class TripRejected(RuntimeError):
+    pass
+
+
+class TripWriter:
+    def __init__(self, target, on_saved=None, workers=2, timeout_s=5, retry_base_s=0.5, retry_max_s=30,
+                 max_attempts=20, on_failed=None):
+        self.target = target
+        self.on_saved = on_saved
+        self.on_failed = on_failed
+        self.max_attempts = max_attempts
+        self.failed = 0
+        self.workers = workers
+        self.timeout_s = timeout_s
+        self.retry_base_s = retry_base_s
+        self.retry_max_s = retry_max_s
+        self._queue = queue.Queue()
+        self._channel = grpc.insecure_channel(target)
+        self._stub = trip_pb2_grpc.TripServiceStub(self._channel)
+
+    def start(self):
+        for i in range(self.workers):
+            threading.Thread(target=self._run, daemon=True, name=f"trip-writer-{i}").start()
+
+    def submit(self, trip):
+        self._queue.put(trip)
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _create(self, trip):
+        req = trip_pb2.CreateTripRequest(trip=trip_pb2.Trip(
+            trip_id=trip["trip_id"],
+            driver_id=trip["driver_id"],
+            rider_ids=trip["rider_ids"],
+            origin_station=trip["origin_station"],
+            destination=trip["destination"],
+            status="scheduled",
+            seats_reserved=len(trip["rider_ids"]),
+            start_time=trip["start_time"],
+        ))
+        resp = self._stub.CreateTrip(req, timeout=self.timeout_s)
+        if not resp.ok:
+            raise TripRejected(resp.reason or "CreateTrip rejected")
+
+    def _write(self, trip):
+        """Store one trip; returns None once stored, else why it was given up."""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self._create(trip)
+                return None
+            except grpc.RpcError as e:
+                if e.code() not in RETRYABLE_CODES:
+                    return f"{e.code().name}: {e.details()}"
+                error = f"{e.code().name}: {e.details()}"
+            except TripRejected as e:
+                error = str(e)
+            except Exception as e:
+                logger.exception("CreateTrip %s failed", trip.get("trip_id"))
+                return repr(e)
+            if attempt >= self.max_attempts:
+                return f"{error} (after {attempt} attempts)"
+            delay = min(self.retry_base_s * 2 ** (attempt - 1), self.retry_max_s)
+            logger.warning("CreateTrip %s failed (attempt %d), retrying in %.1fs: %s", trip["trip_id"], attempt, delay, error)
+            time.sleep(delay)
+
+    def _run(self):
+        while True:
+            trip = self._queue.get()
+            try:
+                reason = self._write(trip)
+                if reason is None:
+                    if self.on_saved is not None:
+                        self.on_saved(trip["trip_id"])
+                    continue
+                self.failed += 1
+                logger.error("Giving up on trip %s: %s", trip.get("trip_id"), reason)
+                if self.on_failed is not None:
+                    self.on_failed(trip, reason)
+            except Exception:
+                # keep the worker alive for the trips queued behind this one
+                logger.exception("Trip writer failed on %s", trip.get("trip_id"))
@@ -1,6 +1,7 @@
 """
 Init script to create PostGIS extension and stations table.
-Run once after Postgres starts.
+Run once after Postgres starts. If the stations table already exists, also
+ensures the GiST indexes used by LocationService's nearest-station query.
 """
 import os
 from sqlalchemy import create_engine, text
@@ -16,5 +17,12 @@ def main():
         conn.commit()
         print("PostGIS extension ensured.")
 
+        # spatial indexes for KNN (<->) and ST_DWithin lookups on stations
+        if conn.execute(text("SELECT to_regclass('stations')")).scalar() is not None:
+            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_stations_geom ON stations USING GIST (geom);"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_stations_geog ON stations USING GIST ((geom::geography));"))
+            conn.commit()
+            print("GiST indexes on stations ensured.")
+
 if __name__ == '__main__':
     main()
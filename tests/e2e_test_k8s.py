@@ -32,6 +32,11 @@ from services.common_lib.protos_generated import (
     trip_pb2, trip_pb2_grpc,
     station_pb2, station_pb2_grpc,
 )
+from services.common_lib.partitioning import PARTITION_QUEUE_ARGS, queue_for_key
+
+# must match lastmile-config: with station sharding MatchingService only
+# consumes the `<queue>.p<N>` partition queues
+MATCHING_PARTITIONS = int(os.getenv("MATCHING_PARTITIONS", "20"))
 
 def get_rabbit_url(use_k8s):
     if use_k8s:
@@ -48,12 +53,21 @@ def rabbit_channel(use_k8s=False):
     conn = pika.BlockingConnection(pika.URLParameters(url))
     return conn, conn.channel()
 
+def declare_station_queue(ch, base, station_id):
+    """Declare and return the queue (partition) MatchingService reads station_id's messages from."""
+    queue = queue_for_key(base, station_id, MATCHING_PARTITIONS)
+    if MATCHING_PARTITIONS > 1:
+        ch.queue_declare(queue=queue, durable=True, arguments=PARTITION_QUEUE_ARGS)
+    else:
+        ch.queue_declare(queue=queue, durable=True)
+    return queue
+
 # -------------------------------------------------------------------
 # 1) Publish rider request
 # -------------------------------------------------------------------
 def publish_rider_request(rider_id, station_id, destination, use_k8s=False):
     conn, ch = rabbit_channel(use_k8s)
-    ch.queue_declare(queue="rider.requests", durable=True)
+    queue = declare_station_queue(ch, "rider.requests", station_id)
 
     req = {
         "rider_id": rider_id,
@@ -64,7 +78,7 @@ def publish_rider_request(rider_id, station_id, destination, use_k8s=False):
 
     ch.basic_publish(
         exchange="",
-        routing_key="rider.requests",
+        routing_key=queue,
         body=json.dumps(req).encode(),
         properties=pika.BasicProperties(delivery_mode=2)
     )
@@ -77,7 +91,7 @@ def publish_rider_request(rider_id, station_id, destination, use_k8s=False):
 # -------------------------------------------------------------------
 def publish_driver_proximity(driver_id, station_id, seats, destination, use_k8s=False):
     conn, ch = rabbit_channel(use_k8s)
-    ch.queue_declare(queue="driver.near_station", durable=True)
+    queue = declare_station_queue(ch, "driver.near_station", station_id)
 
     event = {
         "driver_id": driver_id,
@@ -89,7 +103,7 @@ def publish_driver_proximity(driver_id, station_id, seats, destination, use_k8s=
 
     ch.basic_publish(
         exchange="",
-        routing_key="driver.near_station",
+        routing_key=queue,
         body=json.dumps(event).encode(),
         properties=pika.BasicProperties(delivery_mode=2)
     )
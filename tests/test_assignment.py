@@ -0,0 +1,105 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from services.matching_service.assignment import assign_greedy, assign_riders, hungarian
+
+
+def brute_force_cost(cost):
+    n, m = cost.shape
+    return min(sum(cost[r, c] for r, c in enumerate(cols)) for cols in itertools.permutations(range(m), n))
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_hungarian_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 6))
+    m = int(rng.integers(n, 7))
+    cost = rng.integers(-20, 20, size=(n, m)).astype(float)
+    cols = hungarian(cost)
+    assert len(set(cols)) == n
+    assert cost[np.arange(n), cols].sum() == pytest.approx(brute_force_cost(cost))
+
+
+def test_hungarian_needs_rows_le_columns():
+    with pytest.raises(ValueError):
+        hungarian(np.zeros((3, 2)))
+
+
+def random_case(seed):
+    rng = random.Random(seed)
+    dests = ["A", "B", "C"]
+    drivers = [
+        {
+            "driver_id": f"d{i}",
+            "seats": rng.randint(0, 2),
+            "destinations": set(rng.sample(dests, rng.randint(1, 2))),
+            "departs_at": rng.choice([None, rng.randint(0, 10)]),
+        }
+        for i in range(rng.randint(1, 3))
+    ]
+    riders = [
+        {"rider_id": f"r{i}", "destination": rng.choice(dests), "arrival_time": rng.randint(0, 10)}
+        for i in range(rng.randint(0, 6))
+    ]
+    return drivers, riders
+
+
+def fits(driver, rider):
+    departs_at = driver.get("departs_at")
+    return rider["destination"] in driver["destinations"] and (departs_at is None or rider["arrival_time"] <= departs_at)
+
+
+def max_served(drivers, riders):
+    """Most riders any valid assignment can serve, by trying every seat choice per rider."""
+    slots = [d for d in drivers for _ in range(max(d["seats"], 0))]
+    best = 0
+    for choice in itertools.product([None, *range(len(slots))], repeat=len(riders)):
+        used = [s for s in choice if s is not None]
+        if len(used) != len(set(used)):
+            continue
+        if all(s is None or fits(slots[s], r) for r, s in zip(riders, choice)):
+            best = max(best, len(used))
+    return best
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_assign_riders_serves_as_many_as_possible(seed):
+    drivers, riders = random_case(seed)
+    result = assign_riders(drivers, riders)
+    by_id = {d["driver_id"]: d for d in drivers}
+
+    served = [r["rider_id"] for taken in result.values() for r in taken]
+    assert len(served) == len(set(served))
+    for driver_id, taken in result.items():
+        assert len(taken) <= by_id[driver_id]["seats"]
+        assert all(fits(by_id[driver_id], r) for r in taken)
+        assert [r["arrival_time"] for r in taken] == sorted(r["arrival_time"] for r in taken)
+    assert len(served) == max_served(drivers, riders)
+    assert len(served) >= sum(len(t) for t in assign_greedy(drivers, riders).values())
+
+
+def test_prefers_longest_waiting_riders():
+    drivers = [{"driver_id": "d0", "seats": 1, "destinations": {"A"}, "departs_at": None}]
+    riders = [
+        {"rider_id": "new", "destination": "A", "arrival_time": 5},
+        {"rider_id": "old", "destination": "A", "arrival_time": 1},
+    ]
+    assert [r["rider_id"] for r in assign_riders(drivers, riders)["d0"]] == ["old"]
+
+
+def test_beats_first_come_first_served():
+    # the first driver can take either rider; greedy gives it the one only the second driver could serve
+    drivers = [
+        {"driver_id": "d0", "seats": 1, "destinations": {"A", "B"}, "departs_at": None},
+        {"driver_id": "d1", "seats": 1, "destinations": {"A"}, "departs_at": None},
+    ]
+    riders = [
+        {"rider_id": "r0", "destination": "A", "arrival_time": 1},
+        {"rider_id": "r1", "destination": "B", "arrival_time": 2},
+    ]
+    assert sum(len(t) for t in assign_greedy(drivers, riders).values()) == 1
+    result = assign_riders(drivers, riders)
+    assert {d: [r["rider_id"] for r in t] for d, t in result.items()} == {"d0": ["r1"], "d1": ["r0"]}
@@ -0,0 +1,78 @@
+from services.matching_service import dedup
+from services.matching_service.dedup import DedupCache
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def monotonic(self):
+        return self.now
+
+
+def cache(monkeypatch, clock, **kwargs):
+    monkeypatch.setattr(dedup.time, "monotonic", clock.monotonic)
+    return DedupCache(**kwargs)
+
+
+def test_duplicates_are_dropped(monkeypatch):
+    seen = cache(monkeypatch, Clock())
+    assert seen.check_and_add(("r1", "q1"))
+    assert not seen.check_and_add(("r1", "q1"))
+    assert seen.check_and_add(("r1", "q2"))
+    assert seen.duplicates == 1
+
+
+def test_keys_expire_after_ttl(monkeypatch):
+    clock = Clock()
+    seen = cache(monkeypatch, clock, ttl_s=60)
+    seen.check_and_add(("r1", "q1"))
+    clock.now += 59
+    assert not seen.check_and_add(("r1", "q1"))
+    clock.now += 2
+    assert seen.check_and_add(("r1", "q1"))
+
+
+def test_size_is_bounded(monkeypatch):
+    seen = cache(monkeypatch, Clock(), max_entries=3)
+    for i in range(10):
+        seen.check_and_add(("r", f"q{i}"))
+    assert len(seen) <= 3
+    # the newest keys are the ones kept
+    assert not seen.check_and_add(("r", "q9"))
+
+
+def test_discard_forgets_a_key(monkeypatch):
+    seen = cache(monkeypatch, Clock())
+    seen.add(("r1", "q1"))
+    seen.discard(("r1", "q1"))
+    assert seen.check_and_add(("r1", "q1"))
+
+
+def test_export_restore_keeps_keys_ages_and_order(monkeypatch):
+    clock = Clock()
+    seen = cache(monkeypatch, clock, ttl_s=100)
+    seen.add(("r1", "q1"))
+    clock.now += 30
+    seen.add(("r2", "q2"))
+    clock.now += 10
+    exported = seen.export()
+    assert exported == [["r1", "q1", 40.0], ["r2", "q2", 10.0]]
+
+    # a restarted process: a different monotonic clock
+    clock.now = 5.0
+    restored = DedupCache(ttl_s=100)
+    restored.restore(exported)
+    assert not restored.check_and_add(("r1", "q1"))
+    assert not restored.check_and_add(("r2", "q2"))
+    # r1 was 40 s old when exported: it expires 60 s later, r2 does not yet
+    clock.now += 61
+    assert restored.check_and_add(("r1", "q1"))
+    assert not restored.check_and_add(("r2", "q2"))
+
+
+def test_restore_skips_expired_entries(monkeypatch):
+    seen = cache(monkeypatch, Clock(), ttl_s=100)
+    seen.restore([["r1", "q1", 150.0], ["r2", "q2", 5.0]])
+    assert len(seen) == 1
+    assert seen.check_and_add(("r1", "q1"))
@@ -0,0 +1,87 @@
+from services.location_service.proximity import DWELL, ENTER, EXIT, ProximityTracker
+
+
+def tracker():
+    return ProximityTracker(enter_radius_m=100, exit_radius_m=150, reemit_ms=1000)
+
+
+def at(distances):
+    """distance_to() for a point whose distance to each station is given."""
+    return lambda station_id: distances.get(station_id)
+
+
+def feed(t, driver_id, ts, **distances):
+    """One update from a point with the given station distances; the nearest is reported."""
+    nearest = min(distances.items(), key=lambda kv: kv[1]) if distances else None
+    return [event for event, _, _ in t.update(driver_id, nearest, ts, at(distances))]
+
+
+def test_enter_dwell_exit_sequence():
+    t = tracker()
+    assert feed(t, "d1", 0, S1=300) == []
+    assert feed(t, "d1", 100, S1=90) == [ENTER]
+    assert t.station_of("d1") == "S1"
+    assert feed(t, "d1", 600, S1=40) == []
+    assert feed(t, "d1", 1100, S1=40) == [DWELL]
+    assert feed(t, "d1", 1500, S1=40) == []
+    assert feed(t, "d1", 2100, S1=40) == [DWELL]
+    assert feed(t, "d1", 2200, S1=200) == [EXIT]
+    assert t.station_of("d1") is None
+    assert feed(t, "d1", 2300, S1=200) == []
+
+
+def test_hysteresis_between_radii():
+    t = tracker()
+    feed(t, "d1", 0, S1=90)
+    # beyond the enter radius but within the exit radius: still there
+    assert feed(t, "d1", 100, S1=140) == []
+    assert feed(t, "d1", 200, S1=95) == []
+    assert t.station_of("d1") == "S1"
+
+
+def test_moving_to_another_station():
+    t = tracker()
+    feed(t, "d1", 0, S1=50)
+    events = t.update("d1", ("S2", 60), 100, at({"S1": 170, "S2": 60}))
+    assert events == [(EXIT, "S1", 170), (ENTER, "S2", 60)]
+
+
+def test_unknown_distance_keeps_the_driver_in_place():
+    t = tracker()
+    feed(t, "d1", 0, S1=50)
+    # station index not loaded: no nearest station, no distance
+    assert t.update("d1", None, 100, at({})) == []
+    assert t.station_of("d1") == "S1"
+    # but a known nearby station still wins
+    assert [e for e, _, _ in t.update("d1", ("S2", 30), 200, at({}))] == [EXIT, ENTER]
+
+
+def test_out_of_order_updates_are_ignored():
+    t = tracker()
+    feed(t, "d1", 1000, S1=300)
+    assert feed(t, "d1", 500, S1=50) == []   # older than the last update, even away from a station
+    feed(t, "d1", 2000, S1=50)
+    assert feed(t, "d1", 1500, S1=300) == []
+    assert t.station_of("d1") == "S1"
+
+
+def test_evicts_silent_drivers_wherever_they_are():
+    t = tracker()
+    feed(t, "away", 0, S1=500)
+    feed(t, "parked", 0, S1=50)
+    feed(t, "fresh", 5000, S1=50)
+    assert t.evict_older_than(1000) == [("parked", "S1")]
+    assert len(t) == 1
+    # back after eviction: a fresh enter, not a stale dwell
+    assert feed(t, "parked", 200, S1=50) == [ENTER]
+
+
+def test_forget_drops_matching_drivers():
+    t = tracker()
+    feed(t, "a1", 0, S1=50)
+    feed(t, "b1", 0, S1=50)
+    t.forget(lambda driver_id: driver_id.startswith("a"))
+    assert t.station_of("a1") is None
+    assert t.station_of("b1") == "S1"
+    # its ordering guard is gone too
+    assert feed(t, "a1", -5, S1=50) == [ENTER]
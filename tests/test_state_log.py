@@ -0,0 +1,121 @@
+import json
+import os
+
+# configure the service before importing it: no state dir of its own
+os.environ["MATCHING_STATE_DIR"] = ""
+
+from services.matching_service import app
+from services.matching_service.dedup import DedupCache
+from services.matching_service.state_log import SEGMENT_PREFIX, SNAPSHOT_FILE, StateLog
+
+
+def ops(n, start=0):
+    return [{"op": "seats", "driver_id": f"d{i}", "seats": i} for i in range(start, start + n)]
+
+
+def test_replays_every_op_after_restart(tmp_path):
+    log = StateLog(tmp_path)
+    assert log.load() == (None, [])
+    for op in ops(5):
+        log.append(op)
+    log.close()
+
+    log = StateLog(tmp_path)
+    state, replayed = log.load()
+    assert state is None
+    assert [op["driver_id"] for op in replayed] == [f"d{i}" for i in range(5)]
+    assert [op["seq"] for op in replayed] == [1, 2, 3, 4, 5]
+    # appends continue the sequence
+    log.append({"op": "seats", "driver_id": "d5", "seats": 5})
+    assert log.seq == 6
+    log.close()
+
+
+def test_snapshot_replaces_covered_segments(tmp_path):
+    log = StateLog(tmp_path)
+    log.load()
+    for op in ops(3):
+        log.append(op)
+    token = log.begin_snapshot()
+    for op in ops(2, start=3):
+        log.append(op)
+    log.finish_snapshot(token, {"marker": "at seq 3"})
+    log.close()
+
+    segments = [n for n in os.listdir(tmp_path) if n.startswith(SEGMENT_PREFIX)]
+    assert len(segments) == 1
+    log = StateLog(tmp_path)
+    state, replayed = log.load()
+    assert state == {"marker": "at seq 3"}
+    assert [op["seq"] for op in replayed] == [4, 5]
+    log.close()
+
+
+def test_skips_torn_record(tmp_path):
+    log = StateLog(tmp_path)
+    log.load()
+    for op in ops(2):
+        log.append(op)
+    log.close()
+    segment = sorted(n for n in os.listdir(tmp_path) if n.startswith(SEGMENT_PREFIX))[-1]
+    with open(tmp_path / segment, "a") as f:
+        f.write('{"op":"seats","driver_id":"d2"')   # crash mid-write
+
+    log = StateLog(tmp_path)
+    _, replayed = log.load()
+    assert [op["seq"] for op in replayed] == [1, 2]
+    log.close()
+
+
+def test_snapshot_without_new_ops_keeps_one_segment(tmp_path):
+    log = StateLog(tmp_path)
+    log.load()
+    log.append(ops(1)[0])
+    log.finish_snapshot(log.begin_snapshot(), {})
+    log.finish_snapshot(log.begin_snapshot(), {})
+    log.close()
+    assert sorted(os.listdir(tmp_path)) == [SNAPSHOT_FILE, f"{SEGMENT_PREFIX}{2:012d}"]
+
+
+def comparable(state):
+    # dedup ages move with the clock; the keys and their order must survive
+    return {**state, "seen_requests": [entry[:-1] for entry in state["seen_requests"]]}
+
+
+def test_service_state_round_trip(tmp_path, monkeypatch):
+    empty = {"riders": [], "seats": {}, "destinations": {}}
+    monkeypatch.setattr(app, "seen_requests", DedupCache())
+    monkeypatch.setattr(app, "state_log", None)
+    app.replace_state(empty)
+
+    log = StateLog(tmp_path)
+    log.load()
+    monkeypatch.setattr(app, "state_log", log)
+    app.add_waiting_rider("ST1", {"rider_id": "r1", "request_id": "q1", "destination": "D1", "arrival_time": 1})
+    app.add_waiting_rider("ST1", {"rider_id": "r2", "request_id": "q2", "destination": "D2", "arrival_time": 2})
+    app.seen_requests.add(("r1", "q1"))
+    app.seen_requests.add(("r2", "q2"))
+    app.update_driver("drv1", "D1", 3)
+    app.set_driver_route("drv1", "route-1", ["ST1", "ST2"], "D1")
+    app.take_snapshot()
+    # after the snapshot: only in the log tail
+    app.remove_waiting_riders(["r1"])
+    app.seen_requests.add(("r3", "q3"))
+    app.add_waiting_rider("ST2", {"rider_id": "r3", "request_id": "q3", "destination": "D1", "arrival_time": 3})
+    app.set_driver_seats("drv1", 2)
+    before = json.loads(json.dumps(app.capture_state()))
+    log.close()
+
+    # restart: nothing in memory, everything from the state dir
+    monkeypatch.setattr(app, "state_log", None)
+    app.replace_state(empty)
+    monkeypatch.setattr(app, "seen_requests", DedupCache())
+    monkeypatch.setattr(app, "state_log", StateLog(tmp_path))
+    app.restore_state()
+    after = app.capture_state()
+    app.state_log.close()
+
+    assert comparable(after) == comparable(before)
+    assert app.driver_routes.downstream("drv1", "ST1") == frozenset({"ST2", "D1"})
+    # the matched rider's request is still known as a duplicate
+    assert not app.seen_requests.check_and_add(("r1", "q1"))
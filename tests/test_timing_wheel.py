@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from services.matching_service.timing_wheel import TimingWheel
+
+
+def brute_force_run(levels, wheel_size, seed, steps=400):
+    """Drive a wheel and a dict of deadlines with the same random ops; return mismatches."""
+    rng = random.Random(seed)
+    now = 1_000_000
+    wheel = TimingWheel(now, tick_ms=10, wheel_size=wheel_size, levels=levels)
+    model = {}
+    mismatches = []
+    for step in range(steps):
+        for _ in range(rng.randint(0, 4)):
+            key = f"k{rng.randint(0, 60)}"
+            if rng.random() < 0.2:
+                wheel.cancel(key)
+                model.pop(key, None)
+            else:
+                # up to well beyond the span of every level
+                deadline = now + rng.randint(-50, 10 * wheel_size ** levels * 10)
+                wheel.schedule(key, deadline)
+                model[key] = deadline
+        now += rng.randint(0, 10 * wheel_size * 2)
+        expired = set(wheel.advance(now))
+        due = {k for k, d in model.items() if d // 10 <= now // 10}
+        if expired != due:
+            mismatches.append((step, sorted(expired - due), sorted(due - expired)))
+        for key in due:
+            del model[key]
+        assert len(wheel) == len(model)
+    return mismatches
+
+
+@pytest.mark.parametrize("levels", [1, 2, 3])
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force(levels, seed):
+    assert brute_force_run(levels, wheel_size=8, seed=seed) == []
+
+
+def test_single_level_far_deadline_does_not_fire_early():
+    wheel = TimingWheel(0, tick_ms=1, wheel_size=4, levels=1)
+    wheel.schedule("far", 100)
+    assert wheel.advance(99) == []
+    assert "far" in wheel
+    assert wheel.advance(100) == ["far"]
+
+
+def test_past_deadline_expires_on_next_advance():
+    wheel = TimingWheel(1000, tick_ms=100)
+    wheel.schedule("late", 500)
+    assert wheel.advance(1000) == ["late"]
+    assert len(wheel) == 0
+
+
+def test_cancel_and_reschedule():
+    wheel = TimingWheel(0, tick_ms=10)
+    wheel.schedule("a", 50)
+    wheel.schedule("b", 50)
+    wheel.cancel("a")
+    wheel.schedule("b", 500)
+    assert wheel.advance(100) == []
+    assert wheel.advance(500) == ["b"]
+    assert len(wheel) == 0